@@ -502,9 +502,12 @@ class Dataset:
 
     def file_in_history(self, filepath: Path) -> bool:
         """Check whether a file is in the git history"""
-        return str(filepath) in [
-            o.path for o in self._git_repo.head.commit.tree.traverse()
-        ]
+        # Note : a path lookup in the tree (instead of traversing all objects)
+        try:
+            self._git_repo.head.commit.tree.join(str(filepath).replace("\\", "/"))
+        except KeyError:
+            return False
+        return True
 
     def get_commit_message(self, *, commit_nr: int) -> str:
         """Get the commit message for commit #"""
@@ -2,12 +2,10 @@
 """Manages Docker"""
 from __future__ import annotations
 
+import time
 import typing
 from pathlib import Path
 
-import docker
-from docker.errors import DockerException
-
 import colrev.exceptions as colrev_exceptions
 from colrev.constants import Colors
 
@@ -16,15 +14,33 @@ class DockerManager:
     """The DockerManager manages everything related to Docker
     (e.g. building images, running containers)"""
 
+    # Image tags known to be available (to avoid querying the Docker daemon
+    # for every call). The cache expires because images may be removed.
+    AVAILABLE_IMAGES_TTL = 60
+    _available_images: typing.Set[str] = set()
+    _available_images_updated = 0.0
+
     @classmethod
     def build_docker_image(
         cls, *, imagename: str, dockerfile: typing.Optional[Path] = None
     ) -> None:
         """Build a docker image"""
+        if (
+            imagename in cls._available_images
+            and time.monotonic() - cls._available_images_updated
+            < cls.AVAILABLE_IMAGES_TTL
+        ):
+            return
+
+        # pylint: disable=import-outside-toplevel
+        import docker
+        from docker.errors import DockerException
 
         try:
             client = docker.from_env()
-            repo_tags = [t for image in client.images.list() for t in image.tags]
+            repo_tags = {t for image in client.images.list() for t in image.tags}
+            cls._available_images = repo_tags
+            cls._available_images_updated = time.monotonic()
 
             if imagename not in repo_tags:
                 if dockerfile:
@@ -42,6 +58,7 @@ class DockerManager:
                 else:
                     print(f"Pulling {imagename} Docker image...")
                     client.images.pull(imagename)
+                cls._available_images.add(imagename)
         except DockerException as exc:  # pragma: no cover
             raise colrev_exceptions.ServiceNotAvailableException(
                 dep="docker",
@@ -52,6 +69,8 @@ class DockerManager:
     @classmethod
     def check_docker_installed(cls) -> None:  # pragma: no cover
         """Check whether Docker is installed"""
+        # pylint: disable=import-outside-toplevel
+        import docker
 
         try:
             client = docker.from_env()
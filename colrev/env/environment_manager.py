@@ -4,12 +4,14 @@ from __future__ import annotations
 
 import json
 import logging
+import shutil
 import typing
 from pathlib import Path
 
 import git
 import yaml
 
+import colrev.env.utils
 import colrev.exceptions as colrev_exceptions
 import colrev.ops.check
 import colrev.process.operation
@@ -125,8 +127,10 @@ class EnvironmentManager:
         """Get the committer name and email from git (globals)"""
         global_conf_details = ("NA", "NA")
         try:
-            username = git.config.GitConfigParser().get_value("user", "name")
-            email = git.config.GitConfigParser().get_value("user", "email")
+            # Note : parse the global git config once (for name and email)
+            git_config = git.config.GitConfigParser()
+            username = git_config.get_value("user", "name")
+            email = git_config.get_value("user", "email")
             global_conf_details = (username, email)
         except (git.config.cp.NoSectionError, git.config.cp.NoOptionError) as exc:
             raise colrev_exceptions.CoLRevException(
@@ -137,20 +141,17 @@ class EnvironmentManager:
     def check_git_installed(self) -> None:  # pragma: no cover
         """Check whether git is installed"""
 
-        try:
-            git_instance = git.Git()
-            _ = git_instance.version()
-        except git.GitCommandNotFound as exc:
-            print(exc)
+        # Note : a PATH lookup (instead of running git version in a subprocess)
+        if shutil.which(git.Git.GIT_PYTHON_GIT_EXECUTABLE or "git") is None:
+            print("git is not installed (executable not found)")
 
     def _get_status(self, review_manager: colrev.review_manager.ReviewManager) -> dict:
         status_dict = {}
         status_yml = review_manager.paths.status
-        with open(status_yml, encoding="utf8") as stream:
-            try:
-                status_dict = yaml.safe_load(stream)
-            except yaml.YAMLError as exc:  # pragma: no cover
-                print(exc)
+        try:
+            status_dict = colrev.env.utils.load_yaml_file(status_yml)
+        except yaml.YAMLError as exc:  # pragma: no cover
+            print(exc)
         return status_dict
 
     def get_environment_details(self) -> dict:
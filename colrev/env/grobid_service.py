@@ -6,7 +6,6 @@ import logging
 import time
 import typing
 
-import docker
 import requests
 
 import colrev.env.docker_manager
@@ -68,6 +67,9 @@ class GrobidService:
         except requests.exceptions.ConnectionError:
             pass
 
+        # pylint: disable=import-outside-toplevel
+        import docker
+
         client = docker.from_env()
         logging.info("Running docker container created from %s", self.GROBID_IMAGE)
         logging.info("Starting grobid service...")
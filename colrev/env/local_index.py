@@ -33,11 +33,20 @@ class LocalIndex:
         *,
         index_tei: bool = False,
         verbose_mode: bool = False,
+        cache_tocs: bool = False,
     ) -> None:
         self.verbose_mode = verbose_mode
         self.environment_manager = colrev.env.environment_manager.EnvironmentManager()
         self._index_tei = index_tei
         self.thread_lock = Lock()
+        # With cache_tocs, the records of each toc (None: toc not indexed)
+        # are retrieved once per toc_key (until clear_toc_cache() is called)
+        self._cache_tocs = cache_tocs
+        self._toc_records_cache: typing.Dict[str, typing.Optional[list]] = {}
+
+    def clear_toc_cache(self) -> None:
+        """Clear the cached toc records"""
+        self._toc_records_cache.clear()
 
     def get_journal_rankings(self, journal: str) -> list:
         """Get the journal rankings from the sqlite database"""
@@ -203,6 +212,57 @@ class LocalIndex:
             raise colrev_exceptions.RecordNotInIndexException(toc_key)
         return toc_items
 
+    def _get_toc_record_dicts(self, toc_key: str) -> list:
+        # Note : only used with cache_tocs (all records of the toc are parsed)
+        if toc_key in self._toc_records_cache:
+            cached_toc_record_dicts = self._toc_records_cache[toc_key]
+            if cached_toc_record_dicts is None:
+                raise colrev_exceptions.RecordNotInIndexException(toc_key)
+            return cached_toc_record_dicts
+
+        try:
+            toc_items = self._get_toc_items(toc_key, search_across_tocs=False)
+        except colrev_exceptions.RecordNotInIndexException:
+            self._toc_records_cache[toc_key] = None
+            raise
+
+        # SQLiteIndexRecord() must be after _get_toc_items(), which also uses the sqlite file
+        sqlite_index_record = colrev.env.local_index_sqlite.SQLiteIndexRecord()
+        try:
+            toc_record_dicts = sqlite_index_record.get_many(
+                key=Fields.COLREV_ID, values=toc_items, skip_missing=True
+            )
+        finally:
+            sqlite_index_record.connection.close()
+
+        self._toc_records_cache[toc_key] = toc_record_dicts
+        return toc_record_dicts
+
+    @staticmethod
+    def _iter_toc_record_dicts(
+        sqlite_index_record: colrev.env.local_index_sqlite.SQLiteIndexRecord,
+        toc_items: list,
+    ) -> typing.Iterator[dict]:
+        # The records are retrieved (and parsed) one at a time
+        for toc_records_colrev_id in toc_items:
+            try:
+                yield sqlite_index_record.get(
+                    key=Fields.COLREV_ID, value=toc_records_colrev_id
+                )
+            except colrev_exceptions.RecordNotInIndexException:
+                continue
+
+    @staticmethod
+    def _get_toc_match(
+        record: colrev.record.record.Record, toc_record_dicts: typing.Iterable[dict]
+    ) -> typing.Optional[dict]:
+        for record_dict in toc_record_dicts:
+            if colrev.record.record_similarity.matches(
+                record, colrev.record.record.Record(record_dict)
+            ):
+                return record_dict
+        return None
+
     def retrieve_from_toc(
         self,
         record: colrev.record.record.Record,
@@ -221,24 +281,34 @@ class LocalIndex:
                 record.data[Fields.ID]
             ) from exc
 
-        toc_items = self._get_toc_items(toc_key, search_across_tocs=search_across_tocs)
-        # SQLiteIndexRecord() must be after _get_toc_items(), which also uses the sqlite file
-        sqlite_index_record = colrev.env.local_index_sqlite.SQLiteIndexRecord()
         try:
-            for toc_records_colrev_id in toc_items:
-                record_dict = sqlite_index_record.get(
-                    key=Fields.COLREV_ID, value=toc_records_colrev_id
+            if self._cache_tocs and not search_across_tocs:
+                record_dict = self._get_toc_match(
+                    record, self._get_toc_record_dicts(toc_key)
                 )
+                # The record_dict is cached (prepare_record_for_return modifies it)
+                record_dict = deepcopy(record_dict)
+            else:
+                toc_items = self._get_toc_items(
+                    toc_key, search_across_tocs=search_across_tocs
+                )
+                # SQLiteIndexRecord() must be after _get_toc_items(),
+                # which also uses the sqlite file
+                sqlite_index_record = colrev.env.local_index_sqlite.SQLiteIndexRecord()
+                try:
+                    # Stops at the first match
+                    record_dict = self._get_toc_match(
+                        record,
+                        self._iter_toc_record_dicts(sqlite_index_record, toc_items),
+                    )
+                finally:
+                    sqlite_index_record.connection.close()
 
-                if not colrev.record.record_similarity.matches(
-                    record, colrev.record.record.Record(record_dict)
-                ):
-                    continue
-
-                return prepare_record_for_return(record_dict, include_file=include_file)
-            raise colrev_exceptions.RecordNotInTOCException(
-                record_id=record.data[Fields.ID], toc_key=toc_key
-            )
+            if record_dict is None:
+                raise colrev_exceptions.RecordNotInTOCException(
+                    record_id=record.data[Fields.ID], toc_key=toc_key
+                )
+            return prepare_record_for_return(record_dict, include_file=include_file)
 
         except (
             colrev_exceptions.NotEnoughDataToIdentifyException,
@@ -246,8 +316,6 @@ class LocalIndex:
         ):
             pass
 
-        sqlite_index_record.connection.close()
-
         raise colrev_exceptions.RecordNotInIndexException(record.data[Fields.ID])
 
     def retrieve_based_on_colrev_pdf_id(
@@ -141,6 +141,9 @@ class SQLiteIndexRecord(SQLiteIndex):
 
     INSERT_QUERY = f"INSERT INTO {INDEX_NAME} VALUES(:{', :'.join(KEYS)})"
 
+    # Limit of host parameters per statement in older sqlite versions
+    MAX_QUERY_VARIABLES = 999
+
     UPDATE_RECORD_QUERY = f"""
             UPDATE {INDEX_NAME} SET
             {LocalIndexFields.BIBTEX}=?
@@ -176,6 +179,47 @@ class SQLiteIndexRecord(SQLiteIndex):
         cur.execute(self.INSERT_QUERY, item)
         self.commit()
 
+    def _check_colrev_id_collision(self, *, value: str, retrieved_record: dict) -> None:
+        # Handling collisions in colrev-ids
+        stored_colrev_id = colrev.record.record.Record(retrieved_record).get_colrev_id()
+        if value != stored_colrev_id:  # pragma: no cover
+            print("Collisions (TODO):")
+            print(stored_colrev_id)
+            print(value)
+
+            # print(
+            #     [
+            #         {k: v for k, v in x.items() if k != LocalIndexFields.BIBTEX}
+            #         for x in stored_record
+            #     ]
+            # )
+            # print(item)
+            # to handle the collision:
+            # print(f"Collision: {paper_hash}")
+            # print(cid_to_index)
+            # print(saved_record_cid)
+            # print(saved_record)
+            # paper_hash = self._increment_hash(paper_hash=paper_hash)
+            # item[LocalIndexFields.ID] = paper_hash
+            # continue in while-loop/try to insert...
+            # pylint: disable=raise-missing-from
+            raise NotImplementedError
+
+    def _check_retrieved_record(
+        self, *, key: str, value: str, retrieved_record: dict
+    ) -> None:
+        if key != Fields.COLREV_ID and (
+            key not in retrieved_record or value != retrieved_record[key]
+        ):
+            # Note: colrev-id collisions are handled separately
+            raise colrev_exceptions.RecordNotInIndexException(key)
+
+        # Handling collisions in colrev-ids
+        if key == Fields.COLREV_ID:
+            self._check_colrev_id_collision(
+                value=value, retrieved_record=retrieved_record
+            )
+
     def get(
         self,
         *,
@@ -192,44 +236,54 @@ class SQLiteIndexRecord(SQLiteIndex):
 
             retrieved_record = {}
             retrieved_record = self._get_record_from_row(selected_row)
-            if key != Fields.COLREV_ID and (
-                key not in retrieved_record or value != retrieved_record[key]
-            ):
-                # Note: colrev-id collisions are handled separately
-                raise colrev_exceptions.RecordNotInIndexException(key)
 
         except sqlite3.OperationalError as exc:  # pragma: no cover
             raise colrev_exceptions.RecordNotInIndexException(key) from exc
 
-        # Handling collisions in colrev-ids
-        if key == Fields.COLREV_ID:
-            stored_colrev_id = colrev.record.record.Record(
-                retrieved_record
-            ).get_colrev_id()
-            if value != stored_colrev_id:  # pragma: no cover
-                print("Collisions (TODO):")
-                print(stored_colrev_id)
-                print(value)
-
-                # print(
-                #     [
-                #         {k: v for k, v in x.items() if k != LocalIndexFields.BIBTEX}
-                #         for x in stored_record
-                #     ]
-                # )
-                # print(item)
-                # to handle the collision:
-                # print(f"Collision: {paper_hash}")
-                # print(cid_to_index)
-                # print(saved_record_cid)
-                # print(saved_record)
-                # paper_hash = self._increment_hash(paper_hash=paper_hash)
-                # item[LocalIndexFields.ID] = paper_hash
-                # continue in while-loop/try to insert...
-                # pylint: disable=raise-missing-from
-                raise NotImplementedError
+        self._check_retrieved_record(
+            key=key, value=value, retrieved_record=retrieved_record
+        )
         return retrieved_record
 
+    def get_many(self, *, key: str, values: list, skip_missing: bool = False) -> list:
+        """Get the records matching the values from the index
+        (in the order of the values, like get() for each value).
+        With skip_missing, values that are not in the index are skipped."""
+        if key not in self.SELECT_KEY_QUERIES:
+            # Only the keys supported by get() (the key is part of the query)
+            raise KeyError(key)
+
+        rows_by_value: typing.Dict[str, dict] = {}
+        try:
+            cur = self._get_cursor()
+            for i in range(0, len(values), self.MAX_QUERY_VARIABLES):
+                values_chunk = values[i : i + self.MAX_QUERY_VARIABLES]
+                placeholders = ",".join("?" * len(values_chunk))
+                cur.execute(
+                    f"{self.SELECT_ALL_QUERY} {key} IN ({placeholders})",
+                    values_chunk,
+                )
+                for row in cur.fetchall():
+                    rows_by_value.setdefault(row[key], row)
+        except sqlite3.OperationalError as exc:  # pragma: no cover
+            raise colrev_exceptions.RecordNotInIndexException(key) from exc
+
+        retrieved_records = []
+        for value in values:
+            try:
+                if value not in rows_by_value:
+                    raise colrev_exceptions.RecordNotInIndexException(key)
+                retrieved_record = self._get_record_from_row(rows_by_value[value])
+                self._check_retrieved_record(
+                    key=key, value=value, retrieved_record=retrieved_record
+                )
+            except colrev_exceptions.RecordNotInIndexException:
+                if skip_missing:
+                    continue
+                raise
+            retrieved_records.append(retrieved_record)
+        return retrieved_records
+
     def update(self, local_index_id: str, bibtex: str) -> None:
         """Update a record in the index"""
         cur = self._get_cursor()
@@ -5,17 +5,26 @@ import pkgutil
 import re
 import typing
 import unicodedata
+from copy import deepcopy
 from enum import Enum
+from functools import lru_cache
 from functools import reduce
 from pathlib import Path
 from pathlib import PosixPath
 
+import yaml
 from jinja2 import Environment
 from jinja2 import FunctionLoader
 from jinja2.environment import Template
 
 import colrev.exceptions as colrev_exceptions
 
+# Use the (faster) libyaml-based loader/dumper if it is available
+# pylint: disable=invalid-name
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+# pylint: enable=invalid-name
+
 
 def retrieve_package_file(*, template_file: Path, target: Path) -> None:
     """Retrieve a file from the CoLRev package"""
@@ -72,6 +81,32 @@ def _load_jinja_template(template_path: str) -> str:
     raise colrev_exceptions.TemplateNotAvailableError(template_path)
 
 
+def load_yaml(stream: typing.Any) -> typing.Any:
+    """Load yaml data from a stream or string (safe loader)"""
+    return yaml.load(stream, Loader=_YAML_LOADER)  # nosec
+
+
+def dump_yaml(data: typing.Any, stream: typing.Any) -> None:
+    """Dump yaml data to a stream (safe dumper)"""
+    yaml.dump(data, stream, Dumper=_YAML_DUMPER, allow_unicode=True)
+
+
+@lru_cache(maxsize=100)
+def _load_yaml_file_cached(path: str, mtime_ns: int, size: int) -> typing.Any:
+    # pylint: disable=unused-argument
+    # mtime_ns and size are only part of the cache key (to detect changes)
+    with open(path, encoding="utf8") as file:
+        return load_yaml(file)
+
+
+def load_yaml_file(path: Path) -> typing.Any:
+    """Load yaml data from a file (cached until the file changes)"""
+    stat = path.stat()
+    return deepcopy(
+        _load_yaml_file_cached(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+    )
+
+
 def remove_accents(input_str: str) -> str:
     """Replace the accents in a string"""
 
@@ -6,8 +6,6 @@ import logging
 import typing
 from pathlib import Path
 
-import pandas as pd
-
 import colrev.exceptions as colrev_exceptions
 import colrev.loader.loader
 
@@ -44,6 +42,9 @@ class TableLoader(colrev.loader.loader.Loader):
     @classmethod
     def get_nr_records(cls, filename: Path) -> int:
         """Get the number of records in the file"""
+        # pylint: disable=import-outside-toplevel
+        import pandas as pd
+
         if filename.name.endswith(".csv"):
             data = pd.read_csv(filename)
         elif filename.name.endswith((".xls", ".xlsx")):
@@ -54,6 +55,9 @@ class TableLoader(colrev.loader.loader.Loader):
         return count
 
     def load_records_list(self) -> list:
+        # pylint: disable=import-outside-toplevel
+        import pandas as pd
+
         try:
             if self.filename.name.endswith(".csv"):
                 data = pd.read_csv(self.filename)
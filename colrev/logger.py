@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import os
 import typing
 
 import colrev.exceptions as colrev_exceptions
@@ -10,6 +11,12 @@ import colrev.exceptions as colrev_exceptions
 if typing.TYPE_CHECKING:  # pragma: no cover
     import colrev.review_manager
 
+# The formatter is shared by the handlers of the CoLRev and report loggers
+_FORMATTER = logging.Formatter(
+    fmt="%(asctime)s [%(levelname)s] %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
 
 def setup_logger(
     *, review_manager: colrev.review_manager.ReviewManager, level: int = logging.INFO
@@ -26,12 +33,8 @@ def setup_logger(
         for handler in logger.handlers:
             logger.removeHandler(handler)
 
-    formatter = logging.Formatter(
-        fmt="%(asctime)s [%(levelname)s] %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
     handler = logging.StreamHandler()
-    handler.setFormatter(formatter)
+    handler.setFormatter(_FORMATTER)
     handler.setLevel(level)
 
     logger.addHandler(handler)
@@ -55,19 +58,15 @@ def setup_report_logger(
                 report_logger.removeHandler(handler)
 
         report_logger.setLevel(level)
-        formatter = logging.Formatter(
-            fmt="%(asctime)s [%(levelname)s] %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
         report_path = review_manager.paths.report
         report_file_handler = logging.FileHandler(report_path, mode="a")
-        report_file_handler.setFormatter(formatter)
+        report_file_handler.setFormatter(_FORMATTER)
 
         report_logger.addHandler(report_file_handler)
 
         if logging.DEBUG == level:  # pragma: no cover
             handler = logging.StreamHandler()
-            handler.setFormatter(formatter)
+            handler.setFormatter(_FORMATTER)
             report_logger.addHandler(handler)
         report_logger.propagate = False
     except FileNotFoundError as exc:  # pragma: no cover
@@ -84,10 +83,11 @@ def stop_logger(*, review_manager: colrev.review_manager.ReviewManager) -> None:
         review_manager.report_logger.removeHandler(report_handler)
         report_handler.close()
 
-    report_path = review_manager.paths.report
-    if report_path.is_file():
-        with open(report_path, "r+", encoding="utf8") as file:
-            file.truncate(0)
+    # Note : truncate by path (no need to open the file)
+    try:
+        os.truncate(review_manager.paths.report, 0)
+    except FileNotFoundError:
+        pass
 
 
 def reset_report_logger(*, review_manager: colrev.review_manager.ReviewManager) -> None:
@@ -98,8 +98,5 @@ def reset_report_logger(*, review_manager: colrev.review_manager.ReviewManager)
     report_path = review_manager.paths.report
     file_handler = logging.FileHandler(report_path, mode="a")
     file_handler.setLevel(logging.INFO)
-    formatter = logging.Formatter(
-        fmt="%(asctime)s [%(levelname)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
-    )
-    file_handler.setFormatter(formatter)
+    file_handler.setFormatter(_FORMATTER)
     review_manager.report_logger.addHandler(file_handler)
@@ -2,6 +2,7 @@
 """Checkers for CoLRev repositories"""
 from __future__ import annotations
 
+import logging
 import os
 import re
 import sys
@@ -9,9 +10,9 @@ import typing
 from importlib.metadata import version
 from pathlib import Path
 
-import yaml
 from git.exc import InvalidGitRepositoryError
 
+import colrev.env.utils
 import colrev.exceptions as colrev_exceptions
 from colrev.constants import ExitCodes
 from colrev.constants import Fields
@@ -23,11 +24,39 @@ if typing.TYPE_CHECKING:  # pragma: no cover
     import colrev.review_manager
 
 
+# Note : the triggers of the (source, dest) transitions are computed once
+def _get_triggers_by_states() -> (
+    typing.Dict[typing.Tuple[RecordState, RecordState], list]
+):
+    triggers_by_states: typing.Dict[typing.Tuple[RecordState, RecordState], list] = {}
+    for transition in ProcessModel.transitions:
+        source = typing.cast(RecordState, transition["source"])
+        dest = typing.cast(RecordState, transition["dest"])
+        triggers_by_states.setdefault((source, dest), []).append(transition["trigger"])
+    return triggers_by_states
+
+
+_TRIGGERS_BY_STATES = _get_triggers_by_states()
+
+# Checks are (callable, keyword arguments) pairs
+_CheckScript = typing.Tuple[
+    typing.Callable[..., typing.Any], typing.Dict[str, typing.Any]
+]
+
+
 class Checker:
     """The CoLRev checker makes sure the project setup is ok"""
 
     records: typing.Dict[str, typing.Any] = {}
 
+    _PRE_COMMIT_HOOK_ERRORS = {
+        "pre-commit": "pre-commit hooks not installed (use pre-commit install)",
+        "pre-push": "pre-commit push hooks not installed "
+        "(use pre-commit install --hook-type pre-push)",
+        "prepare-commit-msg": "pre-commit prepare-commit-msg hooks not installed "
+        "(use pre-commit install --hook-type prepare-commit-msg)",
+    }
+
     def __init__(
         self,
         *,
@@ -122,10 +151,9 @@ class Checker:
 
     def _get_installed_hooks(self) -> list:
         installed_hooks = []
-        with open(
-            self.review_manager.paths.pre_commit_config, encoding="utf8"
-        ) as pre_commit_y:
-            pre_commit_config = yaml.load(pre_commit_y, Loader=yaml.SafeLoader)
+        pre_commit_config = colrev.env.utils.load_yaml_file(
+            self.review_manager.paths.pre_commit_config
+        )
         for repository in pre_commit_config["repos"]:
             installed_hooks.extend([hook["id"] for hook in repository["hooks"]])
         return installed_hooks
@@ -146,45 +174,25 @@ class Checker:
             )
 
         if not self.review_manager.in_ci_environment():
-            pch_file = Path(".git/hooks/pre-commit")
-            if pch_file.is_file():
-                with open(pch_file, encoding="utf8") as file:
-                    if "File generated by pre-commit" not in file.read(4096):
-                        raise colrev_exceptions.RepoSetupError(
-                            "pre-commit hooks not installed (use pre-commit install)"
-                        )
-            else:
-                raise colrev_exceptions.RepoSetupError(
-                    "pre-commit hooks not installed (use pre-commit install)"
-                )
-
-            psh_file = Path(".git/hooks/pre-push")
-            if psh_file.is_file():
-                with open(psh_file, encoding="utf8") as file:
-                    if "File generated by pre-commit" not in file.read(4096):
-                        raise colrev_exceptions.RepoSetupError(
-                            "pre-commit push hooks not installed "
-                            "(use pre-commit install --hook-type pre-push)"
-                        )
-            else:
-                raise colrev_exceptions.RepoSetupError(
-                    "pre-commit push hooks not installed "
-                    "(use pre-commit install --hook-type pre-push)"
-                )
-
-            pcmh_file = Path(".git/hooks/prepare-commit-msg")
-            if pcmh_file.is_file():
-                with open(pcmh_file, encoding="utf8") as file:
-                    if "File generated by pre-commit" not in file.read(4096):
-                        raise colrev_exceptions.RepoSetupError(
-                            "pre-commit prepare-commit-msg hooks not installed "
-                            "(use pre-commit install --hook-type prepare-commit-msg)"
-                        )
-            else:
-                raise colrev_exceptions.RepoSetupError(
-                    "pre-commit prepare-commit-msg hooks not installed "
-                    "(use pre-commit install --hook-type prepare-commit-msg)"
-                )
+            # Note : one directory scan instead of a stat() per hook file
+            hooks_dir = Path(".git/hooks")
+            hook_files = {}
+            if hooks_dir.is_dir():
+                with os.scandir(hooks_dir) as entries:
+                    hook_files = {
+                        entry.name: entry.path
+                        for entry in entries
+                        if entry.name in self._PRE_COMMIT_HOOK_ERRORS
+                        and entry.is_file()
+                    }
+
+            for hook_name, error_msg in self._PRE_COMMIT_HOOK_ERRORS.items():
+                if hook_name not in hook_files:
+                    raise colrev_exceptions.RepoSetupError(error_msg)
+                # Note : binary read (no decoding of a possibly truncated character)
+                with open(hook_files[hook_name], "rb") as file:
+                    if b"File generated by pre-commit" not in file.read(4096):
+                        raise colrev_exceptions.RepoSetupError(error_msg)
 
         return True
 
@@ -518,11 +526,9 @@ class Checker:
             # pylint: disable=colrev-missed-constant-usage
             status_transition[record_id] = "load"
         else:
-            proc_transition_list: list = [
-                x["trigger"]
-                for x in ProcessModel.transitions
-                if str(x["source"]) == prior_status[0] and str(x["dest"]) == status
-            ]
+            proc_transition_list: list = list(
+                _TRIGGERS_BY_STATES.get((prior_status[0], status), [])
+            )
             if len(proc_transition_list) == 0 and prior_status[0] != status:
                 status_data["start_states"].append(prior_status[0])
                 if prior_status[0] not in RecordState:
@@ -610,40 +616,11 @@ class Checker:
 
         return status_data
 
-    def check_repo_basics(self) -> list:
-        """Calls data.main() to update the stats"""
-
-        data_operation = self.review_manager.get_data_operation(
-            notify_state_transition_operation=False
-        )
-        records_file = self.review_manager.paths.records
-        if records_file.is_file():
-            self.records = self.review_manager.dataset.load_records_dict()
-
-        check_scripts: list[dict[str, typing.Any]] = []
-        data_checks = [
-            {
-                "script": data_operation.main,
-                "params": {"records": self.records, "silent_mode": True},
-            },
-            {
-                "script": self.review_manager.update_status_yaml,
-                "params": {"records": self.records},
-            },
-        ]
-
-        check_scripts.extend(data_checks)
-
+    def _run_check_scripts(self, check_scripts: typing.List[_CheckScript]) -> list:
         failure_items = []
-        for check_script in check_scripts:
+        for script, kwargs in check_scripts:
             try:
-                if not check_script["params"]:
-                    check_script["script"]()
-                else:
-                    if isinstance(check_script["params"], list):
-                        check_script["script"](*check_script["params"])
-                    else:
-                        check_script["script"](**check_script["params"])
+                script(**kwargs)
             except (
                 colrev_exceptions.MissingDependencyError,
                 colrev_exceptions.GitConflictError,
@@ -658,6 +635,23 @@ class Checker:
                 failure_items.append(f"{type(exc).__name__}: {exc}")
         return failure_items
 
+    def check_repo_basics(self) -> list:
+        """Calls data.main() to update the stats"""
+
+        data_operation = self.review_manager.get_data_operation(
+            notify_state_transition_operation=False
+        )
+        records_file = self.review_manager.paths.records
+        if records_file.is_file():
+            self.records = self.review_manager.dataset.load_records_dict()
+
+        check_scripts: typing.List[_CheckScript] = [
+            (data_operation.main, {"records": self.records, "silent_mode": True}),
+            (self.review_manager.update_status_yaml, {"records": self.records}),
+        ]
+
+        return self._run_check_scripts(check_scripts)
+
     def check_repo_extended(self) -> list:
         """Calls all checks that require prior data (take longer)"""
 
@@ -671,14 +665,11 @@ class Checker:
         # Currently, linting is limited for the scripts.
 
         environment_manager = self.review_manager.get_environment_manager()
-        check_scripts: list[dict[str, typing.Any]] = [
-            {
-                "script": environment_manager.check_git_installed,
-                "params": [],
-            },
-            {"script": self._check_git_conflicts, "params": []},
-            {"script": self.check_repository_setup, "params": []},
-            {"script": self._check_software, "params": []},
+        check_scripts: typing.List[_CheckScript] = [
+            (environment_manager.check_git_installed, {}),
+            (self._check_git_conflicts, {}),
+            (self.check_repository_setup, {}),
+            (self._check_software, {}),
         ]
 
         if self.review_manager.paths.records.is_file():
@@ -686,71 +677,38 @@ class Checker:
                 self.review_manager.paths.RECORDS_FILE
             ):
                 prior = self._retrieve_prior()
-                self.review_manager.logger.debug("prior")
-                self.review_manager.logger.debug(
-                    self.review_manager.p_printer.pformat(prior)
-                )
+                if self.review_manager.logger.isEnabledFor(logging.DEBUG):
+                    self.review_manager.logger.debug("prior")
+                    self.review_manager.logger.debug(
+                        self.review_manager.p_printer.pformat(prior)
+                    )
             else:  # if RECORDS_FILE not yet in git history
                 prior = {}
 
             status_data = self._retrieve_status_data(prior=prior, records=self.records)
 
-            main_refs_checks = [
-                {"script": self.check_sources, "params": []},
+            main_refs_checks: typing.List[_CheckScript] = [
+                (self.check_sources, {}),
             ]
             # Note : duplicate record IDs are already prevented by pybtex...
 
             if prior:  # if RECORDS_FILE in git history
                 main_refs_checks.extend(
                     [
-                        {
-                            "script": self._check_colrev_origins,
-                            "params": {"status_data": status_data},
-                        },
-                        {
-                            "script": self._check_change_in_propagated_ids,
-                            "params": {"prior": prior, "status_data": status_data},
-                        },
-                        {
-                            "script": self.check_status_transitions,
-                            "params": {"status_data": status_data},
-                        },
-                        {
-                            "script": self._check_records_screen,
-                            "params": {"status_data": status_data},
-                        },
-                        {
-                            "script": self.check_fields,
-                            "params": {"status_data": status_data},
-                        },
+                        (self._check_colrev_origins, {"status_data": status_data}),
+                        (
+                            self._check_change_in_propagated_ids,
+                            {"prior": prior, "status_data": status_data},
+                        ),
+                        (self.check_status_transitions, {"status_data": status_data}),
+                        (self._check_records_screen, {"status_data": status_data}),
+                        (self.check_fields, {"status_data": status_data}),
                     ]
                 )
 
             check_scripts.extend(main_refs_checks)
 
-        failure_items = []
-        for check_script in check_scripts:
-            try:
-                if not check_script["params"]:
-                    check_script["script"]()
-                else:
-                    if isinstance(check_script["params"], list):
-                        check_script["script"](*check_script["params"])
-                    else:
-                        check_script["script"](**check_script["params"])
-            except (
-                colrev_exceptions.MissingDependencyError,
-                colrev_exceptions.GitConflictError,
-                colrev_exceptions.PropagatedIDChange,
-                colrev_exceptions.DuplicateIDsError,
-                colrev_exceptions.OriginError,
-                colrev_exceptions.FieldValueError,
-                colrev_exceptions.StatusTransitionError,
-                colrev_exceptions.UnstagedGitChangesError,
-                colrev_exceptions.StatusFieldValueError,
-            ) as exc:
-                failure_items.append(f"{type(exc).__name__}: {exc}")
-        return failure_items
+        return self._run_check_scripts(check_scripts)
 
     def check_repo(self) -> dict:
         """Check whether the repository is in a consistent state
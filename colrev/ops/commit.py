@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import importlib
-import os
+import subprocess  # nosec
 import sys
 import typing
+from functools import lru_cache
 from importlib.metadata import version
 from pathlib import Path
 
@@ -20,6 +21,24 @@ if typing.TYPE_CHECKING:  # pragma: no cover
     import colrev.ops.status
 
 
+@lru_cache(maxsize=None)
+def _get_package_version(package: str) -> str:
+    # Note : importlib.metadata lookups scan the installed distributions
+    # (versions do not change while the process is running)
+    return version(package)
+
+
+@lru_cache(maxsize=None)
+def _get_tool_version(tool: str) -> str:
+    # Note : run without a shell, only once per process
+    try:
+        return subprocess.run(  # nosec
+            [tool, "--version"], capture_output=True, text=True, check=False
+        ).stdout
+    except OSError:  # pragma: no cover
+        return ""
+
+
 class Commit:
     """Create commits"""
 
@@ -67,26 +86,28 @@ class Commit:
         return script_name
 
     def _parse_saved_args(self, saved_args: typing.Optional[dict] = None) -> str:
-        saved_args_str = ""
-        if saved_args is not None:
-            for key, value in saved_args.items():
-                if isinstance(value, (bool, float, int, str)):
-                    if value == "":  # pragma: no cover
-                        saved_args_str += f"     --{key} \\\n"
-                    else:
-                        saved_args_str += f"     --{key}={value} \\\n"
-            # Replace the last backslash (for argument chaining across linebreaks)
-            saved_args_str = saved_args_str.rstrip(" \\\n")
-        return saved_args_str
+        if saved_args is None:
+            return ""
+        saved_args_lines = []
+        for key, value in saved_args.items():
+            if isinstance(value, (bool, float, int, str)):
+                if value == "":  # pragma: no cover
+                    saved_args_lines.append(f"     --{key}")
+                else:
+                    saved_args_lines.append(f"     --{key}={value}")
+        # Backslashes for argument chaining across linebreaks (not after the last line)
+        return " \\\n".join(saved_args_lines)
 
     def _set_versions(self) -> None:
-        self.colrev_version = f'version {version("colrev")}'
+        self.colrev_version = f'version {_get_package_version("colrev")}'
         sys_v = sys.version
         self.python_version = f'version {sys_v[: sys_v.find(" ")]}'
-        stream = os.popen("git --version")
-        self.git_version = stream.read().replace("git ", "").replace("\n", "")
-        stream = os.popen("docker --version")
-        self.docker_version = stream.read().replace("Docker ", "").replace("\n", "")
+        self.git_version = (
+            _get_tool_version("git").replace("git ", "").replace("\n", "")
+        )
+        self.docker_version = (
+            _get_tool_version("docker").replace("Docker ", "").replace("\n", "")
+        )
         if self.docker_version == "":  # pragma: no cover
             self.docker_version = "Not installed"
 
@@ -101,7 +122,7 @@ class Commit:
         ext_script = script_name.split(" ")[0]
         if ext_script != "colrev":
             try:
-                script_version = version(ext_script)
+                script_version = _get_package_version(ext_script)
                 self.ext_script_name = script_name
                 self.ext_script_version = f"version {script_version}"
             except importlib.metadata.PackageNotFoundError:
@@ -114,15 +135,18 @@ class Commit:
 
     def _get_version_flag(self) -> str:
         flag = ""
-        if "dirty" in version("colrev"):  # pragma: no cover
+        if "dirty" in _get_package_version("colrev"):  # pragma: no cover
             flag = "*"
         return flag
 
     def _get_commit_report(self, status_operation: colrev.ops.status.Status) -> str:
-        report = self._get_commit_report_header()
-        report += status_operation.get_review_status_report(colors=False)
-        report += self._get_commit_report_details()
-        return report
+        return "".join(
+            [
+                self._get_commit_report_header(),
+                status_operation.get_review_status_report(colors=False),
+                self._get_commit_report_details(),
+            ]
+        )
 
     def _get_commit_report_header(self) -> str:
         template = colrev.env.utils.get_template("ops/commit/commit_report_header.txt")
@@ -138,8 +162,7 @@ class Commit:
         processing_report = ""
         report_path = self.review_manager.paths.report
         if report_path.is_file():
-            processing_report = "\nProcessing report\n"
-            processing_report += "".join(report_path.read_text())
+            processing_report = "\nProcessing report\n" + report_path.read_text()
         return processing_report
 
     def create(self, *, skip_status_yaml: bool = False) -> bool:
@@ -159,28 +182,31 @@ class Commit:
 
         self.review_manager.logger.debug("Prepare commit: checks and updates")
         if not skip_status_yaml:
-            status_yml = self.review_manager.paths.status
+            # Note : update_status_yaml also adds the status file to git
             self.review_manager.update_status_yaml()
-            self.review_manager.dataset.add_changes(status_yml)
 
         committer, email = self.review_manager.get_committer()
 
+        git_committer = git.Actor(committer, email)
         if self.manual_author:
-            git_author = git.Actor(committer, email)
+            git_author = git_committer
         else:
             git_author = git.Actor(f"script:{self.script_name}", email)
 
+        self.records_committed = self.review_manager.paths.records.is_file()
+        self.completeness_condition = self.review_manager.get_completeness_condition()
+
         # Note : this should run as the last command before creating the commit
         # to ensure that the git tree_hash is up-to-date.
-        self.tree_hash = self.review_manager.dataset.get_tree_hash()
+        # The tree_hash is only reported (git write-tree only called) if records are committed.
+        self.tree_hash = ""
+        if self.records_committed:
+            self.tree_hash = self.review_manager.dataset.get_tree_hash()
         try:
             self.last_commit_sha = self.review_manager.dataset.get_last_commit_sha()
         except ValueError:
             pass
 
-        self.records_committed = self.review_manager.paths.records.is_file()
-        self.completeness_condition = self.review_manager.get_completeness_condition()
-
         self.msg = (
             self.msg
             + self._get_version_flag()
@@ -190,7 +216,7 @@ class Commit:
         git_repo.index.commit(
             self.msg,
             author=git_author,
-            committer=git.Actor(committer, email),
+            committer=git_committer,
             skip_hooks=self.skip_hooks,
         )
 
@@ -310,6 +310,8 @@ class Load(colrev.process.operation.Operation):
                 f" {Colors.GREEN}{source_record['ID']}".ljust(46)
                 + f"md_retrieved →  {source_record['colrev_status']}{Colors.END}"
             )
+        # Release the tocs cached by the quality model (scoped to the source)
+        self.quality_model.reset()
 
         self.review_manager.logger.debug(
             f"Save records {source.search_source.filename}"
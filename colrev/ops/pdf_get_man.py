@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import csv
+import logging
+import os
 import typing
 from pathlib import Path
 
-import pandas as pd
-
 import colrev.exceptions as colrev_exceptions
 import colrev.process.operation
 import colrev.record.record
@@ -42,21 +42,25 @@ class PDFGetMan(colrev.process.operation.Operation):
         )
         self.verbose = True
 
+    def iter_pdf_get_man(self, records: dict) -> typing.Iterator[dict]:
+        """Iterate over the records that are missing a PDF"""
+        return (
+            record
+            for record in records.values()
+            if record[Fields.STATUS] == RecordState.pdf_needs_manual_retrieval
+        )
+
     def get_pdf_get_man(self, records: dict) -> list:
         """Get the records that are missing a PDF"""
-        missing_records = []
-        for record in records.values():
-            if record[Fields.STATUS] == RecordState.pdf_needs_manual_retrieval:
-                missing_records.append(record)
-        return missing_records
+        return list(self.iter_pdf_get_man(records))
 
     def export_retrieval_table(self, records: dict) -> None:
         """Export a table for manual PDF retrieval"""
 
-        missing_records = self.get_pdf_get_man(records)
+        missing_records = self.iter_pdf_get_man(records)
+        first_missing_record = next(missing_records, None)
 
-        if len(missing_records) > 0:
-            missing_records_df = pd.DataFrame.from_records(missing_records)
+        if first_missing_record is not None:
             # pylint: disable=duplicate-code
             col_order = [
                 Fields.ID,
@@ -70,11 +74,20 @@ class PDFGetMan(colrev.process.operation.Operation):
                 Fields.PAGES,
                 Fields.DOI,
             ]
-            missing_records_df = missing_records_df.reindex(col_order, axis=1)
             self.missing_pdf_files_csv.parent.mkdir(exist_ok=True, parents=True)
-            missing_records_df.to_csv(
-                self.missing_pdf_files_csv, index=False, quoting=csv.QUOTE_ALL
-            )
+            with open(
+                self.missing_pdf_files_csv, "w", encoding="utf-8", newline=""
+            ) as file:
+                writer = csv.DictWriter(
+                    file,
+                    fieldnames=col_order,
+                    extrasaction="ignore",
+                    quoting=csv.QUOTE_ALL,
+                    lineterminator=os.linesep,
+                )
+                writer.writeheader()
+                writer.writerow(first_missing_record)
+                writer.writerows(missing_records)
 
             self.review_manager.logger.info(
                 f"Created {self.missing_pdf_files_csv} with paper details"
@@ -103,22 +116,20 @@ class PDFGetMan(colrev.process.operation.Operation):
         records_headers = self.review_manager.dataset.load_records_dict(
             header_only=True
         )
-        record_header_list = list(records_headers.values())
-        nr_tasks = len(
-            [
-                x
-                for x in record_header_list
-                if RecordState.pdf_needs_manual_retrieval == x[Fields.STATUS]
-            ]
-        )
-        pad = min((max(len(x[Fields.ID]) for x in record_header_list) + 2), 40)
+        nr_tasks, max_id_length = 0, 0
+        for record_header in records_headers.values():
+            max_id_length = max(max_id_length, len(record_header[Fields.ID]))
+            if record_header[Fields.STATUS] == RecordState.pdf_needs_manual_retrieval:
+                nr_tasks += 1
+        pad = min(max_id_length + 2, 40)
         items = self.review_manager.dataset.read_next_record(
             conditions=[{Fields.STATUS: RecordState.pdf_needs_manual_retrieval}]
         )
         pdf_get_man_data = {"nr_tasks": nr_tasks, "PAD": pad, "items": items}
-        self.review_manager.logger.debug(
-            self.review_manager.p_printer.pformat(pdf_get_man_data)
-        )
+        if self.review_manager.logger.isEnabledFor(logging.DEBUG):
+            self.review_manager.logger.debug(
+                self.review_manager.p_printer.pformat(pdf_get_man_data)
+            )
         return pdf_get_man_data
 
     def pdfs_retrieved_manually(self) -> bool:
@@ -2,6 +2,7 @@
 """CoLRev pdf_prep_man operation: Prepare PDF documents manually."""
 from __future__ import annotations
 
+import logging
 from pathlib import Path
 
 import pandas as pd
@@ -74,9 +75,10 @@ class PDFPrepMan(colrev.process.operation.Operation):
             conditions=[{Fields.STATUS: RecordState.pdf_needs_manual_preparation}]
         )
         pdf_prep_man_data = {"nr_tasks": nr_tasks, "PAD": pad, "items": items}
-        self.review_manager.logger.debug(
-            self.review_manager.p_printer.pformat(pdf_prep_man_data)
-        )
+        if self.review_manager.logger.isEnabledFor(logging.DEBUG):
+            self.review_manager.logger.debug(
+                self.review_manager.p_printer.pformat(pdf_prep_man_data)
+            )
         return pdf_prep_man_data
 
     def pdfs_prepared_manually(self) -> bool:
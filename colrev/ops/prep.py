@@ -8,6 +8,7 @@ import multiprocessing as mp
 import random
 import shutil
 import typing
+from collections import Counter
 from copy import deepcopy
 from datetime import datetime
 from datetime import timedelta
@@ -112,7 +113,14 @@ class Prep(colrev.process.operation.Operation):
 
         # Note: for unit testing, we use a simple loop (instead of parallel)
         # to ensure that the IDs of feed records don't change
-        unit_testing = "test_prep" == inspect.stack()[1][3]
+        # Note : only the caller frame is needed (inspect.stack() would collect
+        # the source context of all frames)
+        frame = inspect.currentframe()
+        unit_testing = (
+            frame is not None
+            and frame.f_back is not None
+            and "test_prep" == frame.f_back.f_code.co_name
+        )
         if unit_testing:
             self._cpu = 1
 
@@ -785,14 +793,9 @@ class Prep(colrev.process.operation.Operation):
                 )
 
     def _log_commit_details(self, prepared_records: list) -> None:
-        nr_recs = len(
-            [
-                record
-                for record in prepared_records
-                if record[Fields.STATUS] == RecordState.md_prepared
-            ]
-        )
+        status_counts = Counter(record[Fields.STATUS] for record in prepared_records)
 
+        nr_recs = status_counts[RecordState.md_prepared]
         self.review_manager.logger.info(
             "md_prepared".ljust(29)
             + f"{Colors.GREEN}{nr_recs}{Colors.END}".rjust(20, " ")
@@ -813,13 +816,7 @@ class Prep(colrev.process.operation.Operation):
             + f" records ({nr_recs/len(prepared_records):.2%})"
         )
 
-        nr_recs = len(
-            [
-                record
-                for record in prepared_records
-                if record[Fields.STATUS] == RecordState.md_needs_manual_preparation
-            ]
-        )
+        nr_recs = status_counts[RecordState.md_needs_manual_preparation]
         if nr_recs > 0:
             self.review_manager.logger.info(
                 "md_needs_manual_preparation".ljust(29)
@@ -827,13 +824,7 @@ class Prep(colrev.process.operation.Operation):
                 + f" records ({nr_recs/len(prepared_records):.2%})"
             )
 
-        nr_recs = len(
-            [
-                record
-                for record in prepared_records
-                if record[Fields.STATUS] == RecordState.rev_prescreen_excluded
-            ]
-        )
+        nr_recs = status_counts[RecordState.rev_prescreen_excluded]
         if nr_recs > 0:
             self.review_manager.logger.info(
                 "rev_prescreen_excluded".ljust(29)
@@ -963,6 +954,8 @@ class Prep(colrev.process.operation.Operation):
                     prepared_records = pool.map(self.prepare, preparation_data)
                     pool.close()
                     pool.join()
+                # Release the tocs cached by the quality model (scoped to the round)
+                self.quality_model.reset()
 
                 self._complete_resumed_operation(prepared_records)
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import csv
+import logging
 from pathlib import Path
 
 import pandas as pd
@@ -241,9 +242,10 @@ class PrepMan(colrev.process.operation.Operation):
             "all_ids": all_ids,
             "PAD": pad,
         }
-        self.review_manager.logger.debug(
-            self.review_manager.p_printer.pformat(md_prep_man_data)
-        )
+        if self.review_manager.logger.isEnabledFor(logging.DEBUG):
+            self.review_manager.logger.debug(
+                self.review_manager.p_printer.pformat(md_prep_man_data)
+            )
         return md_prep_man_data
 
     def set_data(self, *, record_dict: dict) -> None:
@@ -5,8 +5,6 @@ from __future__ import annotations
 import io
 import typing
 
-import yaml
-
 import colrev.env.utils
 import colrev.process.operation
 from colrev.constants import Colors
@@ -59,7 +57,7 @@ class Status(colrev.process.operation.Operation):
             # -> integrate with get_status (current data) -
             # and get_prior? (levels: aggregated_statistics vs. record-level?)
 
-            data_loaded = yaml.safe_load(var_t)
+            data_loaded = colrev.env.utils.load_yaml(var_t)
             analytics_dict[len(revlist) - ind] = {
                 "atomic_steps": data_loaded["atomic_steps"],
                 "completed_atomic_steps": data_loaded["completed_atomic_steps"],
@@ -10,9 +10,7 @@ from importlib.metadata import version
 from pathlib import Path
 
 import git
-import pandas as pd
 from tqdm import tqdm
-from yaml import safe_load
 
 import colrev.env.utils
 import colrev.exceptions as colrev_exceptions
@@ -681,14 +679,27 @@ class Upgrade(colrev.process.operation.Operation):
                     result[key] = str(value)  # type: ignore
             return result
 
+        def _flatten(data: dict, prefix: str = "") -> dict:
+            # Flatten nested dicts (keys joined with ".", like pd.json_normalize)
+            flat: dict = {}
+            for key, value in data.items():
+                flat_key = f"{prefix}.{key}" if prefix else key
+                if isinstance(value, dict):
+                    flat.update(_flatten(value, flat_key))
+                else:
+                    flat[flat_key] = value
+            return flat
+
         if registry_yaml.is_file():
             backup_file = Path(str(registry_yaml) + ".bk")
             print(
                 f"Found a yaml file, converting to json, it will be backed up as {backup_file}"
             )
             with open(registry_yaml, encoding="utf8") as file:
-                environment_registry_df = pd.json_normalize(safe_load(file))
-                repos = environment_registry_df.to_dict("records")
+                registry_data = colrev.env.utils.load_yaml(file) or []
+                if isinstance(registry_data, dict):
+                    registry_data = [registry_data]
+                repos = [_flatten(repo) for repo in registry_data]
                 environment_registry = {
                     "local_index": {
                         "repos": repos,
@@ -10,12 +10,15 @@ from pathlib import Path
 from typing import Any
 from typing import Dict
 
-import toml
-
 import colrev.package_manager.package_base_classes as base_classes
 from colrev.constants import Colors
 from colrev.package_manager.package_base_classes import BASECLASS_MAP
 
+if sys.version_info >= (3, 11):
+    import tomllib
+else:  # pragma: no cover
+    import tomli as tomllib
+
 
 def _check_package_installed(data: dict) -> bool:
     package_name = data["project"]["name"]
@@ -187,8 +190,8 @@ def main() -> None:
     file_path = "pyproject.toml"
 
     try:
-        with open(file_path, encoding="utf-8") as file:
-            data = toml.load(file)
+        with open(file_path, "rb") as file:
+            data = tomllib.load(file)
 
         failed_checks = _validate_structure(data, checks)
         if failed_checks:
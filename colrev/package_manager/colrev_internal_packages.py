@@ -5,12 +5,16 @@ from __future__ import annotations
 import json
 import os
 import subprocess
+import sys
 import tempfile
 from importlib.metadata import distribution
 from importlib.metadata import PackageNotFoundError
 from pathlib import Path
 
-import toml
+if sys.version_info >= (3, 11):
+    import tomllib
+else:  # pragma: no cover
+    import tomli as tomllib
 
 
 # pylint: disable=too-many-return-statements
@@ -97,8 +101,8 @@ def get_internal_packages_dict() -> dict:
             pyproject_path = os.path.join(package_path, "pyproject.toml")
             if not os.path.exists(pyproject_path):
                 continue
-            with open(pyproject_path, encoding="utf-8") as file:
-                pyproject_data = toml.load(file)
+            with open(pyproject_path, "rb") as file:
+                pyproject_data = tomllib.load(file)
             package_name = pyproject_data["project"]["name"]
 
             internal_packages_dict[package_name] = package_path
@@ -2,15 +2,17 @@
 """Discovering and using packages."""
 from __future__ import annotations
 
+import functools
 import json
 import os
+import sys
 import tempfile
 import typing
 from pathlib import Path
 
 import inquirer
 import requests
-import toml
+import requests_cache
 from bs4 import BeautifulSoup
 from m2r import parse_from_file
 
@@ -19,11 +21,47 @@ from colrev.constants import EndpointType
 from colrev.constants import Filepaths
 from colrev.constants import SearchType
 
+if sys.version_info >= (3, 11):
+    import tomllib
+else:  # pragma: no cover
+    import tomli as tomllib
+
 
 INTERNAL_PACKAGES = (
     colrev.package_manager.colrev_internal_packages.get_internal_packages_dict()
 )
 
+DOCS_MANUAL_DIR = Filepaths.COLREV_PATH / "docs/source/manual"
+# Target directory of the package docs (rst)
+DOCS_PACKAGES_DIR = DOCS_MANUAL_DIR / "packages"
+# Command to add an endpoint of the package (shown in the package docs)
+ENDPOINT_ADD_COMMANDS = {
+    EndpointType.review_type: "colrev init --type",
+    EndpointType.search_source: "colrev search --add",
+    EndpointType.prep: "colrev prep --add",
+    EndpointType.prep_man: "colrev prep-man --add",
+    EndpointType.dedupe: "colrev dedupe --add",
+    EndpointType.prescreen: "colrev prescreen --add",
+    EndpointType.pdf_get: "colrev pdf-get --add",
+    EndpointType.pdf_get_man: "colrev pdf-get-man --add",
+    EndpointType.pdf_prep: "colrev pdf-prep --add",
+    EndpointType.pdf_prep_man: "colrev pdf-prep-man --add",
+    EndpointType.screen: "colrev screen --add",
+    EndpointType.data: "colrev data --add",
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _get_session() -> requests_cache.CachedSession:
+    # Created when the docs are fetched (not when the module is imported).
+    # Cached responses expire immediately: each request is revalidated
+    # with the server (ETag/Last-Modified) before the cached content is reused
+    return requests_cache.CachedSession(
+        str(Filepaths.LOCAL_ENVIRONMENT_DIR / Path("package_docs_cache.sqlite")),
+        backend="sqlite",
+        expire_after=0,
+    )
+
 
 # pylint: disable=too-many-instance-attributes
 class PackageDoc:
@@ -97,10 +135,8 @@ class PackageDoc:
 
         if package_id in INTERNAL_PACKAGES:
             self.package_dir = Path(INTERNAL_PACKAGES[package_id])
-            with open(
-                self.package_dir / Path("pyproject.toml"), encoding="utf-8"
-            ) as file:
-                self.package_metadata = toml.load(file)
+            with open(self.package_dir / "pyproject.toml", "rb") as file:
+                self.package_metadata = tomllib.load(file)
 
             assert str(self.package_dir).endswith(
                 package_id.replace("colrev.", "")
@@ -112,19 +148,25 @@ class PackageDoc:
     def _initialize_from_pypi(self, package_id: str) -> bool:
         self.monorepo = False
 
-        response = requests.get(f"https://pypi.org/pypi/{package_id}/json", timeout=30)
-        if response.status_code != 200:
+        response = _get_session().get(
+            f"https://pypi.org/pypi/{package_id}/json", timeout=30
+        )
+        if response.status_code == 404:
             return False
+        response.raise_for_status()
         try:
             repo_url = response.json()["info"].get("project_urls", {}).get("repository")
         except AttributeError:
             print(f"Failed to get repository URL for package {package_id}")
             return False
-        gh_response = requests.get(f"{repo_url}/raw/main/pyproject.toml", timeout=30)
-        if response.status_code != 200:
+        gh_response = _get_session().get(
+            f"{repo_url}/raw/main/pyproject.toml", timeout=30
+        )
+        if gh_response.status_code == 404:
             return False
+        gh_response.raise_for_status()
 
-        self.package_metadata = toml.loads(gh_response.text)
+        self.package_metadata = tomllib.loads(gh_response.text)
 
         return True
 
@@ -138,19 +180,34 @@ class PackageDoc:
 
         return ", ".join(author["name"] for author in self.authors)
 
-    def _get_docs_short_description(self) -> str:
+    @functools.cached_property
+    def _docs_short_description(self) -> str:
         return (
             self.description
             + " (:doc:`instructions </manual/packages/"
             + f"{self.package_id}>`)"
         )
 
+    @functools.cached_property
+    def _endpoint_item_base(self) -> dict:
+        # Shared by all endpoints of the package (dev_status is set after __init__)
+        status = (
+            self.dev_status.replace("stable", "|STABLE|")
+            .replace("maturing", "|MATURING|")
+            .replace("experimental", "|EXPERIMENTAL|")
+        )
+        return {
+            "package_endpoint_identifier": self.package_id,
+            "status": status,
+            "short_description": self._docs_short_description,
+        }
+
     def _set_docs_package_readme_path(self, colrev_doc_link: str) -> None:
 
         if self.monorepo:
             self.docs_package_readme_path = self.package_dir / colrev_doc_link
         else:
-            response = requests.get(
+            response = _get_session().get(
                 self.repository + "/raw/main/" + colrev_doc_link, timeout=30
             )
             if response.status_code != 200:
@@ -166,7 +223,6 @@ class PackageDoc:
             )
 
     # pylint: disable=line-too-long
-    # pylint: disable=too-many-branches
     # pylint: disable=too-many-statements
     # flake8: noqa: E501
     def _get_header_info(self) -> str:
@@ -242,30 +298,8 @@ class PackageDoc:
             if self.has_endpoint(endpoint_type):
                 header_info += f"   * - {endpoint_type.value}\n"
                 header_info += f"     - |{self.dev_status.upper()}|\n"
-                if endpoint_type == EndpointType.review_type:
-                    header_info += f"     - .. code-block:: \n\n\n         colrev init --type {self.package_id}\n\n"
-                elif endpoint_type == EndpointType.search_source:
-                    header_info += f"     - .. code-block:: \n\n\n         colrev search --add {self.package_id}\n\n"
-                elif endpoint_type == EndpointType.prep:
-                    header_info += f"     - .. code-block:: \n\n\n         colrev prep --add {self.package_id}\n\n"
-                elif endpoint_type == EndpointType.prep_man:
-                    header_info += f"     - .. code-block:: \n\n\n         colrev prep-man --add {self.package_id}\n\n"
-                elif endpoint_type == EndpointType.dedupe:
-                    header_info += f"     - .. code-block:: \n\n\n         colrev dedupe --add {self.package_id}\n\n"
-                elif endpoint_type == EndpointType.prescreen:
-                    header_info += f"     - .. code-block:: \n\n\n         colrev prescreen --add {self.package_id}\n\n"
-                elif endpoint_type == EndpointType.pdf_get:
-                    header_info += f"     - .. code-block:: \n\n\n         colrev pdf-get --add {self.package_id}\n\n"
-                elif endpoint_type == EndpointType.pdf_get_man:
-                    header_info += f"     - .. code-block:: \n\n\n         colrev pdf-get-man --add {self.package_id}\n\n"
-                elif endpoint_type == EndpointType.pdf_prep:
-                    header_info += f"     - .. code-block:: \n\n\n         colrev pdf-prep --add {self.package_id}\n\n"
-                elif endpoint_type == EndpointType.pdf_prep_man:
-                    header_info += f"     - .. code-block:: \n\n\n         colrev pdf-prep-man --add {self.package_id}\n\n"
-                elif endpoint_type == EndpointType.screen:
-                    header_info += f"     - .. code-block:: \n\n\n         colrev screen --add {self.package_id}\n\n"
-                elif endpoint_type == EndpointType.data:
-                    header_info += f"     - .. code-block:: \n\n\n         colrev data --add {self.package_id}\n\n"
+                add_command = ENDPOINT_ADD_COMMANDS[endpoint_type]
+                header_info += f"     - .. code-block:: \n\n\n         {add_command} {self.package_id}\n\n"
 
         return header_info
 
@@ -273,10 +307,7 @@ class PackageDoc:
         """Import the package documentation"""
 
         with open(
-            Filepaths.COLREV_PATH
-            / Path(f"docs/source/manual/packages/{self.docs_rst_path}"),
-            "w",
-            encoding="utf-8",
+            DOCS_PACKAGES_DIR / self.docs_rst_path, "w", encoding="utf-8"
         ) as file:
             file.write(self._get_header_info())
             output = parse_from_file(self.docs_package_readme_path)
@@ -297,16 +328,7 @@ class PackageDoc:
         }
         """
 
-        status = (
-            self.dev_status.replace("stable", "|STABLE|")
-            .replace("maturing", "|MATURING|")
-            .replace("experimental", "|EXPERIMENTAL|")
-        )
-        endpoint_item = {
-            "package_endpoint_identifier": self.package_id,
-            "status": status,
-            "short_description": self._get_docs_short_description(),
-        }
+        endpoint_item = dict(self._endpoint_item_base)
 
         if endpoint_type == EndpointType.search_source:
             endpoint_item["search_types"] = self.search_types  # type: ignore
@@ -326,7 +348,7 @@ class PackageDoc:
         """
         item = {
             "identifier": self.package_id,
-            "short_description": self._get_docs_short_description(),
+            "short_description": self._docs_short_description,
             "path": self.docs_rst_path,
         }
         return item
@@ -348,27 +370,17 @@ class DocRegistryManager:
     """DocRegistryManager"""
 
     # Overview page of packages: rst
-    docs_packages_index_path = Filepaths.COLREV_PATH / Path(
-        "docs/source/manual/packages.rst"
-    )
+    docs_packages_index_path = DOCS_MANUAL_DIR / "packages.rst"
     # Overview page of packages: json
-    docs_packages_overview_json_file = Filepaths.COLREV_PATH / Path(
-        "docs/source/manual/packages_overview.json"
-    )
+    docs_packages_overview_json_file = DOCS_MANUAL_DIR / "packages_overview.json"
 
     # Overviews of endpoints
-    docs_package_endpoints_json_file = Filepaths.COLREV_PATH / Path(
-        "docs/source/manual/package_endpoints.json"
-    )
+    docs_package_endpoints_json_file = DOCS_MANUAL_DIR / "package_endpoints.json"
 
     # Overviews of search source types
-    docs_search_source_types_json_file = Filepaths.COLREV_PATH / Path(
-        "docs/source/manual/search_source_types.json"
-    )
+    docs_search_source_types_json_file = DOCS_MANUAL_DIR / "search_source_types.json"
 
-    pypi_ignored_packages_file = Filepaths.COLREV_PATH / Path(
-        "docs/source/manual/pypi_ignored_packages.json"
-    )
+    pypi_ignored_packages_file = DOCS_MANUAL_DIR / "pypi_ignored_packages.json"
 
     package_endpoints_json: typing.Dict[str, list] = {x.value: [] for x in EndpointType}
     docs_for_index: typing.Dict[str, list] = {x.value: [] for x in EndpointType}
@@ -387,11 +399,12 @@ class DocRegistryManager:
                 package_doc.dev_status = package_data["dev_status"]
                 self.packages.append(package_doc)
             except (
-                toml.decoder.TomlDecodeError,
+                tomllib.TOMLDecodeError,
                 NotImplementedError,
                 ValueError,
                 KeyError,
                 AttributeError,
+                requests.exceptions.RequestException,
             ) as exc:
                 print(f"Error loading package {package_id}")
                 print(exc)
@@ -399,18 +412,30 @@ class DocRegistryManager:
         # Add package endpoints
         os.chdir(Filepaths.COLREV_PATH)
         for package in self.packages:
+            if not any(
+                package.has_endpoint(endpoint_type) for endpoint_type in EndpointType
+            ):
+                continue
+
+            # Note : the docs are imported once per package (not per endpoint)
+            package.import_package_docs()
+            docs_item = package.get_docs_item()
             for endpoint_type in EndpointType:
                 if not package.has_endpoint(endpoint_type):
                     continue
 
                 print(f"-  {package.package_id} / {endpoint_type.value}")
 
-                package.import_package_docs()
-
                 self.package_endpoints_json[endpoint_type.value].append(
                     package.get_endpoint_item(endpoint_type)
                 )
-                self.docs_for_index[endpoint_type.value].append(package.get_docs_item())
+                self.docs_for_index[endpoint_type.value].append(docs_item)
+
+    def _dump_json(self, data: typing.Any, path: Path) -> None:
+        # json.dump streams the encoded chunks instead of building the full string
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(data, file, indent=4)
+            file.write("\n")  # to avoid pre-commit/eof-fix changes
 
     def _extract_search_source_types(self) -> None:
         search_source_types: typing.Dict[str, list] = {}
@@ -427,12 +452,7 @@ class DocRegistryManager:
                 key=lambda d: d["package_endpoint_identifier"],
             )
 
-        json_object = json.dumps(search_source_types, indent=4)
-        with open(
-            self.docs_search_source_types_json_file, "w", encoding="utf-8"
-        ) as file:
-            file.write(json_object)
-            file.write("\n")  # to avoid pre-commit/eof-fix changes
+        self._dump_json(search_source_types, self.docs_search_source_types_json_file)
 
     def _update_package_endpoints_json(self) -> None:
         for key in self.package_endpoints_json.keys():
@@ -442,14 +462,10 @@ class DocRegistryManager:
             )
 
         self.docs_package_endpoints_json_file.unlink(missing_ok=True)
-        json_object = json.dumps(self.package_endpoints_json, indent=4)
-        with open(self.docs_package_endpoints_json_file, "w", encoding="utf-8") as file:
-            file.write(json_object)
-            file.write("\n")  # to avoid pre-commit/eof-fix changes
-
-        with open(Filepaths.PACKAGES_ENDPOINTS_JSON, "w", encoding="utf-8") as file:
-            file.write(json_object)
-            file.write("\n")  # to avoid pre-commit/eof-fix changes
+        self._dump_json(
+            self.package_endpoints_json, self.docs_package_endpoints_json_file
+        )
+        self._dump_json(self.package_endpoints_json, Filepaths.PACKAGES_ENDPOINTS_JSON)
 
     def _update_packages_overview(self) -> None:
         packages_overview = []
@@ -462,10 +478,7 @@ class DocRegistryManager:
                 packages_overview.append(package)
 
         self.docs_packages_overview_json_file.unlink(missing_ok=True)
-        json_object = json.dumps(packages_overview, indent=4)
-        with open(self.docs_packages_overview_json_file, "w", encoding="utf-8") as file:
-            file.write(json_object)
-            file.write("\n")  # to avoid pre-commit/eof-fix changes
+        self._dump_json(packages_overview, self.docs_packages_overview_json_file)
 
     def _write_docs_for_index(self) -> None:
         """Writes data from self.docs_for_index to the packages.rst file."""
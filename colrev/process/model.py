@@ -2,7 +2,6 @@
 """The process model."""
 from __future__ import annotations
 
-import logging
 import typing
 
 import colrev.exceptions as colrev_exceptions
@@ -108,51 +107,39 @@ class ProcessModel:
     @classmethod
     def get_valid_transitions(cls, *, state: RecordState) -> set:
         """Get the list of valid transitions"""
-        logging.getLogger("transitions").setLevel(logging.WARNING)
-        return set({x["trigger"] for x in cls.transitions if x["source"] == state})
+        return set(_VALID_TRANSITIONS.get(state, ()))
 
     @classmethod
     def get_preceding_states(cls, *, state: RecordState) -> set:
         """Get the states preceding the state that is given as a parameter"""
 
-        logging.getLogger("transitions").setLevel(logging.WARNING)
         preceding_states: set[RecordState] = set()
-        added = True
-        while added:
-            preceding_states_size = len(preceding_states)
-            for transition in ProcessModel.transitions:
-                if (
-                    transition["dest"] in preceding_states
-                    or state == transition["dest"]
-                ):
-                    preceding_states.add(transition["source"])  # type: ignore
-            if preceding_states_size == len(preceding_states):
-                added = False
+        states_to_visit = [state]
+        while states_to_visit:
+            current_state = states_to_visit.pop()
+            for source_state in _SOURCE_STATES.get(current_state, ()):
+                if source_state not in preceding_states:
+                    preceding_states.add(source_state)
+                    states_to_visit.append(source_state)
         return preceding_states
 
+    @staticmethod
+    def _get_states_set(operation: colrev.process.operation.Operation) -> set:
+        records_headers = operation.review_manager.dataset.load_records_dict(
+            header_only=True
+        )
+        return {el[Fields.STATUS] for el in records_headers.values()}
+
     @classmethod
     def check_operation_precondition(
         cls, operation: colrev.process.operation.Operation
     ) -> None:
         """Check the preconditions for an operation"""
 
-        def get_states_set() -> set:
-            records_headers = operation.review_manager.dataset.load_records_dict(
-                header_only=True
-            )
-            record_header_list = list(records_headers.values())
-
-            return {el[Fields.STATUS] for el in record_header_list}
-
         if operation.review_manager.settings.project.delay_automated_processing:
-            start_states = [
-                x["source"]
-                for x in ProcessModel.transitions
-                if operation.type == x["trigger"]
-            ]
-            state: RecordState = start_states[0]  # type: ignore
+            state = _START_STATES[operation.type]
 
-            cur_state_list = get_states_set()
+            cur_state_list = cls._get_states_set(operation)
             # self.review_manager.logger.debug(f"cur_state_list: {cur_state_list}")
             # self.review_manager.logger.debug(f"precondition: {self.state}")
             required_absent = cls.get_preceding_states(state=state)
@@ -167,3 +154,27 @@ class ProcessModel:
                 raise colrev_exceptions.ProcessOrderViolation(
                     operation.type.name, str(state), list(violating_states)
                 )
+
+
+# Note : the transitions are static, the lookup tables are computed once (on import)
+_VALID_TRANSITIONS: typing.Dict[RecordState, typing.FrozenSet[OperationsType]] = {
+    state: frozenset(
+        typing.cast(OperationsType, x["trigger"])
+        for x in ProcessModel.transitions
+        if x["source"] == state
+    )
+    for state in RecordState
+}
+_SOURCE_STATES: typing.Dict[RecordState, typing.FrozenSet[RecordState]] = {
+    state: frozenset(
+        typing.cast(RecordState, x["source"])
+        for x in ProcessModel.transitions
+        if x["dest"] == state
+    )
+    for state in RecordState
+}
+# The start state of an operation is the source of its first transition
+_START_STATES: typing.Dict[OperationsType, RecordState] = {
+    typing.cast(OperationsType, x["trigger"]): typing.cast(RecordState, x["source"])
+    for x in reversed(ProcessModel.transitions)
+}
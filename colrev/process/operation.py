@@ -4,12 +4,11 @@ from __future__ import annotations
 
 import typing
 
-import docker
 import git
-from docker.errors import DockerException
 
 import colrev.exceptions as colrev_exceptions
 from colrev.constants import OperationsType
+from colrev.paths import PathManager
 from colrev.process.model import ProcessModel
 
 if typing.TYPE_CHECKING:  # pragma: no cover
@@ -17,6 +16,21 @@ if typing.TYPE_CHECKING:  # pragma: no cover
 
 F = typing.TypeVar("F", bound=typing.Callable[..., typing.Any])
 
+# Preconditions of the operations:
+# (require a clean repository, files ignored in the clean-repo check)
+_PRECONDITIONS: typing.Dict[OperationsType, typing.Tuple[bool, list]] = {
+    OperationsType.load: (True, [PathManager.SEARCH_DIR, PathManager.SETTINGS_FILE]),
+    OperationsType.prep_man: (True, [PathManager.RECORDS_FILE_GIT]),
+    OperationsType.prep: (True, []),
+    OperationsType.dedupe: (True, []),
+    OperationsType.prescreen: (True, []),
+    OperationsType.pdf_prep: (True, []),
+    OperationsType.screen: (True, []),
+    OperationsType.pdf_get: (True, [PathManager.PDF_DIR]),
+    OperationsType.pdf_get_man: (True, [PathManager.PDF_DIR]),
+    OperationsType.data: (False, []),
+}
+
 
 class Operation:
     """Operations correspond to the work steps in a CoLRev project"""
@@ -61,6 +75,10 @@ class Operation:
 
     def conclude(self) -> None:  # pragma: no cover
         """Conclude the operation (stop Docker containers)"""
+        # pylint: disable=import-outside-toplevel
+        import docker
+        from docker.errors import DockerException
+
         try:
             client = docker.from_env()
             for container in client.containers.list():
@@ -72,6 +90,20 @@ class Operation:
     def _check_model_precondition(self) -> None:
         ProcessModel.check_operation_precondition(self)
 
+    @staticmethod
+    def _is_ignored(
+        path: typing.Optional[str], ignored_prefixes: typing.Tuple[str, ...]
+    ) -> bool:
+        # Note : a prefix matches the file itself or the files in its directory
+        # (data/pdfs should not match data/pdfs_old/...)
+        if not path:
+            return False
+        path = path.replace("\\", "/")
+        return any(
+            path == prefix or path.startswith(prefix + "/")
+            for prefix in ignored_prefixes
+        )
+
     def _require_clean_repo_general(
         self,
         *,
@@ -79,38 +111,52 @@ class Operation:
     ) -> bool:
 
         # Note : not considering untracked files.
-        git_repo = git.Repo(self.review_manager.path)
+        # Note : reuse the repository object of the dataset (if available)
+        if hasattr(self.review_manager, "dataset"):
+            git_repo = self.review_manager.dataset.get_repo()
+        else:  # pragma: no cover
+            git_repo = git.Repo(self.review_manager.path)
 
         # Principle: working tree always has to be clean
         # because processing functions may change content
-        if git_repo.is_dirty(index=False):
-            changed_files = [item.a_path for item in git_repo.index.diff(None)]
+        # Note : the diffs are computed once (each call runs git)
+        unstaged_changes = git_repo.index.diff(None)
+        if unstaged_changes:
+            changed_files = [item.a_path for item in unstaged_changes]
             raise colrev_exceptions.UnstagedGitChangesError(changed_files)
 
-        if not git_repo.is_dirty():
+        if not git_repo.head.is_valid():  # pragma: no cover
+            # No commits yet
+            return True
+
+        staged_changes = git_repo.head.commit.diff()
+        if not staged_changes:
             return True
 
+        # Note : the ignored files are repository-relative paths (prefixes of a_path)
         ignored_file_list = [str(self.review_manager.paths.STATUS_FILE)]
         if ignored_files:
             ignored_file_list += ignored_files
-        ignored_file_list = [str(x).replace("\\", "/") for x in ignored_file_list]
+        ignored_prefixes = tuple(
+            str(x).replace("\\", "/").rstrip("/") for x in ignored_file_list
+        )
+
+        # The working tree is clean (checked above): only staged changes remain
+        # Note : the list of changed files is only needed for the error message
+        if all(
+            self._is_ignored(item.a_path or item.b_path, ignored_prefixes)
+            for item in staged_changes
+        ):
+            return True
 
         changed_files = [
-            item.a_path
-            for item in git_repo.index.diff(None)
-            if not any(ip in item.a_path.replace("\\", "/") for ip in ignored_file_list)
-        ] + [
-            item.a_path
-            for item in git_repo.head.commit.diff()
-            if not any(ip in item.a_path.replace("\\", "/") for ip in ignored_file_list)
+            item.a_path or item.b_path
+            for item in staged_changes
+            if not self._is_ignored(item.a_path or item.b_path, ignored_prefixes)
         ]
-
-        if changed_files:
-            raise colrev_exceptions.CleanRepoRequiredError(
-                changed_files, ",".join(ignored_file_list)
-            )
-
-        return True  # pragma: no cover
+        raise colrev_exceptions.CleanRepoRequiredError(
+            changed_files, ",".join(ignored_prefixes)
+        )
 
     def check_precondition(self) -> None:
         """Check the operation precondition"""
@@ -118,44 +164,14 @@ class Operation:
         if self.review_manager.force_mode:
             return
 
-        if self.type == OperationsType.load:
-            self._require_clean_repo_general(
-                ignored_files=[
-                    self.review_manager.paths.SEARCH_DIR,
-                    self.review_manager.paths.SETTINGS_FILE,
-                ]
-            )
-            self._check_model_precondition()
-
-        elif self.type == OperationsType.prep_man:  # pragma: no cover
-            self._require_clean_repo_general(
-                ignored_files=[self.review_manager.paths.RECORDS_FILE_GIT]
-            )
-            self._check_model_precondition()
-
-        elif self.type in [
-            OperationsType.prep,
-            OperationsType.dedupe,
-            OperationsType.prescreen,
-            OperationsType.pdf_prep,
-            OperationsType.screen,
-        ]:
-            self._require_clean_repo_general()
-            self._check_model_precondition()
-
-        elif self.type in [
-            OperationsType.pdf_get,
-            OperationsType.pdf_get_man,
-        ]:
-            self._require_clean_repo_general(
-                ignored_files=[self.review_manager.paths.PDF_DIR]
-            )
-            self._check_model_precondition()
-
-        elif self.type == OperationsType.data:
-            self._check_model_precondition()
-
         # ie., implicit pass for check, pdf_prep_man
+        if self.type not in _PRECONDITIONS:
+            return
+
+        require_clean_repo, ignored_files = _PRECONDITIONS[self.type]
+        if require_clean_repo:
+            self._require_clean_repo_general(ignored_files=ignored_files)
+        self._check_model_precondition()
 
     def notify(self, *, state_transition: bool = True) -> None:
         """Notify the review_manager about the next operation"""
@@ -2,7 +2,6 @@
 """Checker for mostly-all-caps fields."""
 from __future__ import annotations
 
-import colrev.env.utils
 import colrev.record.qm.quality_model
 from colrev.constants import DefectCodes
 from colrev.constants import Fields
@@ -10,11 +9,36 @@ from colrev.constants import FieldValues
 
 # pylint: disable=too-few-public-methods
 
+_ASCII_UPPER = bytes(range(65, 91))
+_ASCII_LOWER = bytes(range(97, 123))
+
+
+def _percent_upper_ascii_letters(value: str) -> float:
+    """Share of upper-case letters among the ASCII letters in value
+
+    Equivalent to colrev.env.utils.percent_upper_chars, but counts in C
+    (bytes.translate) instead of a regex substitution and a per-character loop.
+    """
+    ascii_value = value.encode("ascii", "ignore")
+    nr_upper = len(ascii_value) - len(ascii_value.translate(None, _ASCII_UPPER))
+    nr_lower = len(ascii_value) - len(ascii_value.translate(None, _ASCII_LOWER))
+    if nr_upper + nr_lower == 0:
+        return 0.0
+    return nr_upper / (nr_upper + nr_lower)
+
 
 class MostlyAllCapsFieldChecker:
     """The MostlyAllCapsFieldChecker"""
 
     msg = DefectCodes.MOSTLY_ALL_CAPS
+    _fields_to_check = (
+        Fields.AUTHOR,
+        Fields.TITLE,
+        Fields.JOURNAL,
+        Fields.BOOKTITLE,
+        Fields.EDITOR,
+    )
+    _container_title_fields = frozenset({Fields.JOURNAL, Fields.BOOKTITLE})
 
     def __init__(
         self, quality_model: colrev.record.qm.quality_model.QualityModel
@@ -23,17 +47,12 @@ class MostlyAllCapsFieldChecker:
 
     def run(self, *, record: colrev.record.record.Record) -> None:
         """Run the mostly-all-caps checks"""
-        for key in [
-            Fields.AUTHOR,
-            Fields.TITLE,
-            Fields.JOURNAL,
-            Fields.BOOKTITLE,
-            Fields.EDITOR,
-        ]:
+        unknown = FieldValues.UNKNOWN
+        for key in self._fields_to_check:
             if (
                 key not in record.data
                 or record.ignored_defect(key=key, defect=self.msg)
-                or record.data[key] == FieldValues.UNKNOWN
+                or record.data[key] == unknown
             ):
                 continue
 
@@ -45,30 +64,30 @@ class MostlyAllCapsFieldChecker:
             else:
                 record.remove_field_provenance_note(key=key, note=self.msg)
 
+    @classmethod
     def _is_mostly_all_caps(
-        self, *, record: colrev.record.record.Record, key: str
+        cls, *, record: colrev.record.record.Record, key: str
     ) -> bool:
         """Check if the field is mostly all caps"""
 
+        value = record.data[key]
+
         # Online sources/software can be short/have caps
         if (
-            record.data.get(Fields.ENTRYTYPE, "") == "online"
-            and key == Fields.TITLE
-            and len(record.data[Fields.TITLE]) < 10
+            key == Fields.TITLE
+            and len(value) < 10
+            and record.data.get(Fields.ENTRYTYPE, "") == "online"
         ):
             return False
 
-        if (
-            colrev.env.utils.percent_upper_chars(record.data[key].replace(" and ", ""))
-            < 0.7
-        ):
+        if _percent_upper_ascii_letters(value.replace(" and ", "")) < 0.7:
             return False
 
         # container-title-abbreviated
-        if key in [Fields.JOURNAL, Fields.BOOKTITLE] and len(record.data[key]) < 6:
+        if key in cls._container_title_fields and len(value) < 6:
             return False
 
-        if record.data[key].upper() == "PLOS ONE":
+        if value.upper() == "PLOS ONE":
             return False
 
         return True
@@ -2,6 +2,8 @@
 """Checker for record-not-in-toc."""
 from __future__ import annotations
 
+import typing
+
 import colrev.env.local_index
 import colrev.exceptions as colrev_exceptions
 import colrev.record.qm.quality_model
@@ -21,7 +23,22 @@ class RecordNotInTOCChecker:
         self, quality_model: colrev.record.qm.quality_model.QualityModel
     ) -> None:
         self.quality_model = quality_model
-        self.local_index = colrev.env.local_index.LocalIndex(verbose_mode=False)
+        self._local_index: typing.Optional[colrev.env.local_index.LocalIndex] = None
+
+    @property
+    def local_index(self) -> colrev.env.local_index.LocalIndex:
+        """The LocalIndex (only created when a toc is checked)"""
+        if self._local_index is None:
+            # The records of each toc are retrieved once (until reset() is called)
+            self._local_index = colrev.env.local_index.LocalIndex(
+                verbose_mode=False, cache_tocs=True
+            )
+        return self._local_index
+
+    def reset(self) -> None:
+        """Reset the cached tocs"""
+        if self._local_index is not None:
+            self._local_index.clear_toc_cache()
 
     def run(self, *, record: colrev.record.record.Record) -> None:
         """Run the record-not-in-toc checks"""
@@ -94,3 +94,10 @@ class QualityModel:
         if self.pdf_mode:
             record.data.pop(Fields.TEXT_FROM_PDF, None)
             record.data.pop(Fields.NR_PAGES_IN_FILE, None)
+
+    def reset(self) -> None:
+        """Reset the checkers' caches (e.g., tocs retrieved from the local index)"""
+
+        for checker in self.checkers:
+            if hasattr(checker, "reset"):
+                checker.reset()
@@ -5,10 +5,6 @@ from __future__ import annotations
 import re
 import typing
 
-import pandas as pd
-from bib_dedupe.bib_dedupe import block
-from bib_dedupe.bib_dedupe import match
-from bib_dedupe.bib_dedupe import prep
 from rapidfuzz import fuzz
 
 import colrev.env.utils
@@ -252,6 +248,13 @@ def matches(
     record_a: colrev.record.record.Record, record_b: colrev.record.record.Record
 ) -> bool:
     """Determine whether two records match (correspond to the same entity)."""
+    # Note : pandas and bib_dedupe are imported here (expensive import on startup)
+    # pylint: disable=import-outside-toplevel
+    import pandas as pd
+    from bib_dedupe.bib_dedupe import block
+    from bib_dedupe.bib_dedupe import match
+    from bib_dedupe.bib_dedupe import prep
+
     record_a_dict = record_a.copy().get_data()
     record_b_dict = record_b.copy().get_data()
     record_a_dict[Fields.ID] = "a"
@@ -11,9 +11,9 @@ from pathlib import Path
 
 import git
 import requests_cache
-import yaml
 
 import colrev.dataset
+import colrev.env.utils
 import colrev.exceptions as colrev_exceptions
 import colrev.logger
 import colrev.ops.check
@@ -207,25 +207,24 @@ class ReviewManager:
         import colrev.ops.commit
         import colrev.ops.correct
 
-        with open(msg_file, encoding="utf8") as file:
-            available_contents = file.read()
-
-        with open(msg_file, "w", encoding="utf8") as file:
-            file.write(available_contents)
-            # Don't append if it's already there
-            # update = False
-            # if "Command" not in available_contents:
-            #     update = True
-            # if "Properties" in available_contents:
-            #     update = False
-            # if update:
-            commit = colrev.ops.commit.Commit(
-                review_manager=self,
-                msg=available_contents,
-                manual_author=True,
-                script_name="MANUAL",
-            )
-            commit.update_report(msg_file=msg_file)
+        # Note : the message file is not truncated/re-written
+        # (the report is appended by update_report)
+        available_contents = msg_file.read_text(encoding="utf8")
+
+        # Don't append if it's already there
+        # update = False
+        # if "Command" not in available_contents:
+        #     update = True
+        # if "Properties" in available_contents:
+        #     update = False
+        # if update:
+        commit = colrev.ops.commit.Commit(
+            review_manager=self,
+            msg=available_contents,
+            manual_author=True,
+            script_name="MANUAL",
+        )
+        commit.update_report(msg_file=msg_file)
 
         if (
             not self.settings.is_curated_masterdata_repo()
@@ -257,7 +256,7 @@ class ReviewManager:
         exported_dict.pop("screening_statistics")
         exported_dict.pop("nr_origins")
         with open(self.paths.status, "w", encoding="utf8") as file:
-            yaml.dump(exported_dict, file, allow_unicode=True)
+            colrev.env.utils.dump_yaml(exported_dict, file)
         if add_to_git:
             self.dataset.add_changes(self.paths.STATUS_FILE)
 
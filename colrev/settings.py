@@ -3,8 +3,12 @@
 from __future__ import annotations
 
 import json
+import os
+import sys
 import typing
+from collections import Counter
 from pathlib import Path
+from pathlib import PureWindowsPath
 
 from pydantic import BaseModel
 from pydantic import Field
@@ -74,6 +78,15 @@ class ProjectSettings(BaseModel):
 
 # Search
 
+# Temporary attributes (load operation) that are not saved to the settings
+_SEARCH_SOURCE_LOAD_FIELDS = frozenset(
+    {"to_import", "imported_origins", "len_before", "source_records_list"}
+)
+# Labels of the search types (for printing the sources)
+_SEARCH_TYPE_LABELS = {
+    search_type: str(search_type).lower() for search_type in SearchType
+}
+
 
 class SearchSource(BaseModel):
     """Search source settings"""
@@ -95,18 +108,19 @@ class SearchSource(BaseModel):
     def validate_filename(cls, values):  # type: ignore
         """Validate the filename"""
         filename = values.get("filename")
-        if filename and not str(filename).replace("\\", "/").startswith("data/search"):
+        # Note : PureWindowsPath splits on both "/" and "\\"
+        if filename and PureWindowsPath(filename).parts[:2] != ("data", "search"):
             raise colrev_exceptions.InvalidSettingsError(
                 msg=f"Source filename does not start with data/search: {filename}"
             )
         return values
 
     def model_dump(self, **kwargs) -> dict:  # type: ignore
-        exclude = set(kwargs.pop("exclude", set()))
-        exclude.add("to_import")
-        exclude.add("imported_origins")
-        exclude.add("len_before")
-        exclude.add("source_records_list")
+        exclude = kwargs.pop("exclude", None)
+        if exclude:
+            exclude = _SEARCH_SOURCE_LOAD_FIELDS.union(exclude)
+        else:
+            exclude = _SEARCH_SOURCE_LOAD_FIELDS
         return super().model_dump(exclude=exclude, **kwargs)
 
     def setup_for_load(
@@ -128,13 +142,14 @@ class SearchSource(BaseModel):
 
     def get_origin_prefix(self) -> str:
         """Get the corresponding origin prefix"""
-        assert not any(x in str(self.filename.name) for x in [";", "/"])
-        return str(self.filename.name).lstrip("/")
+        name = self.filename.name
+        assert ";" not in name and "/" not in name
+        return name
 
     def is_md_source(self) -> bool:
         """Check whether the source is a metadata source (for preparation)"""
 
-        return str(self.filename.name).startswith("md_")
+        return self.filename.name.startswith("md_")
 
     def is_curated_source(self) -> bool:
         """Check whether the source is a curated source (for preparation)"""
@@ -170,7 +185,8 @@ class SearchSource(BaseModel):
 
     def __str__(self) -> str:
         formatted_str = (
-            f"{str(self.search_type).lower()}: {self.endpoint} >> {self.filename}"
+            f"{_SEARCH_TYPE_LABELS[self.search_type]}: "
+            f"{self.endpoint} >> {self.filename}"
         )
         if self.search_parameters:
             formatted_str += f"\n   search parameters:   {self.search_parameters}"
@@ -335,10 +351,8 @@ class ScreenSettings(BaseModel):
         criteria_str = "- Criteria: []"
         if self.criteria:
             criteria_str = "- Criteria:\n - " + "\n - ".join(
-                [
-                    f"{short_name}: " + str(criterion)
-                    for short_name, criterion in self.criteria.items()
-                ]
+                f"{short_name}: {criterion}"
+                for short_name, criterion in self.criteria.items()
             )
         return criteria_str + "\n" + endpoints_str
 
@@ -384,85 +398,92 @@ class Settings(BaseModel):
         data["sources"] = sources_dump
         return data
 
+    def _get_curation_state(self) -> typing.Tuple[bool, bool]:
+        """Get (curated, curated_masterdata) from a single scan of the endpoints"""
+        # Note : not cached because the data_package_endpoints can be changed
+        # during a run (e.g., when data packages are added)
+        for endpoint in self.data.data_package_endpoints:
+            if endpoint["endpoint"] == "colrev.colrev_curation":
+                return True, bool(endpoint.get("curated_masterdata"))
+        return False, False
+
     def is_curated_repo(self) -> bool:
         """Check whether data is curated in this repository"""
 
-        curation_endpoints = [
-            x
-            for x in self.data.data_package_endpoints
-            if x["endpoint"] == "colrev.colrev_curation"
-        ]
-        return bool(curation_endpoints)
+        return self._get_curation_state()[0]
 
     def is_curated_masterdata_repo(self) -> bool:
         """Check whether the masterdata is curated in this repository"""
 
-        curation_endpoints = [
-            x
-            for x in self.data.data_package_endpoints
-            if x["endpoint"] == "colrev.colrev_curation"
-        ]
-
-        if curation_endpoints:
-            curation_endpoint = curation_endpoints[0]
-            if curation_endpoint["curated_masterdata"]:
-                return True
-        return False
+        return self._get_curation_state()[1]
 
     def __str__(self) -> str:
-        sources_str = "\n- " + "\n- ".join(
-            [str(s) for s in self.sources if s.is_md_source()]
-            + [str(s) for s in self.sources if not s.is_md_source()]
+        md_sources: typing.List[str] = []
+        other_sources: typing.List[str] = []
+        for source in self.sources:
+            (md_sources if source.is_md_source() else other_sources).append(str(source))
+        sources_str = "\n- " + "\n- ".join(md_sources + other_sources)
+
+        return "".join(
+            [
+                str(self.project),
+                "\nSearch\n",
+                str(self.search),
+                "\nSources",
+                sources_str,
+                "\nPreparation\n",
+                str(self.prep),
+                "\nDedupe\n",
+                str(self.dedupe),
+                "\nPrescreen\n",
+                str(self.prescreen),
+                "\nPDF get\n",
+                str(self.pdf_get),
+                "\nPDF prep\n",
+                str(self.pdf_prep),
+                "\nScreen\n",
+                str(self.screen),
+                "\nData\n",
+                str(self.data),
+            ]
         )
 
-        return (
-            str(self.project)
-            + "\nSearch\n"
-            + str(self.search)
-            + "\nSources"
-            + sources_str
-            + "\nPreparation\n"
-            + str(self.prep)
-            + "\nDedupe\n"
-            + str(self.dedupe)
-            + "\nPrescreen\n"
-            + str(self.prescreen)
-            + "\nPDF get\n"
-            + str(self.pdf_get)
-            + "\nPDF prep\n"
-            + str(self.pdf_prep)
-            + "\nScreen\n"
-            + str(self.screen)
-            + "\nData\n"
-            + str(self.data)
-        )
+    def _get_package_endpoint_lists(self) -> typing.List[list]:
+        return [
+            self.prep.prep_man_package_endpoints,
+            self.dedupe.dedupe_package_endpoints,
+            self.prescreen.prescreen_package_endpoints,
+            self.pdf_get.pdf_get_package_endpoints,
+            self.pdf_get.pdf_get_man_package_endpoints,
+            self.pdf_prep.pdf_prep_package_endpoints,
+            self.pdf_prep.pdf_prep_man_package_endpoints,
+            self.screen.screen_package_endpoints,
+            self.data.data_package_endpoints,
+        ] + [p_round.prep_package_endpoints for p_round in self.prep.prep_rounds]
 
     def get_packages(self) -> typing.List[str]:
         """Get the list of all package names"""
 
-        def extract_endpoints(package_endpoints: list) -> list:
-            return [
+        all_packages = [self.project.review_type] + [s.endpoint for s in self.sources]
+        for package_endpoints in self._get_package_endpoint_lists():
+            all_packages.extend(
                 e for pe in package_endpoints for k, e in pe.items() if k == "endpoint"
-            ]
-
-        all_packages = (
-            [self.project.review_type]
-            + [s.endpoint for s in self.sources]
-            + extract_endpoints(self.prep.prep_man_package_endpoints)
-            + extract_endpoints(self.dedupe.dedupe_package_endpoints)
-            + extract_endpoints(self.prescreen.prescreen_package_endpoints)
-            + extract_endpoints(self.pdf_get.pdf_get_package_endpoints)
-            + extract_endpoints(self.pdf_get.pdf_get_man_package_endpoints)
-            + extract_endpoints(self.pdf_prep.pdf_prep_package_endpoints)
-            + extract_endpoints(self.pdf_prep.pdf_prep_man_package_endpoints)
-            + extract_endpoints(self.screen.screen_package_endpoints)
-            + extract_endpoints(self.data.data_package_endpoints)
-        )
-        for p_round in self.prep.prep_rounds:
-            all_packages.extend(extract_endpoints(p_round.prep_package_endpoints))
+            )
 
         return all_packages
 
+    def intern_endpoint_names(self) -> None:
+        """Intern the endpoint names (they repeat and are compared frequently)"""
+        self.project.review_type = sys.intern(self.project.review_type)
+        for source in self.sources:
+            source.endpoint = sys.intern(source.endpoint)
+        for package_endpoints in self._get_package_endpoint_lists():
+            for package_endpoint in package_endpoints:
+                if isinstance(package_endpoint.get("endpoint"), str):
+                    package_endpoint["endpoint"] = sys.intern(
+                        package_endpoint["endpoint"]
+                    )
+
 
 def _add_missing_attributes(loaded_dict: dict) -> None:  # pragma: no cover
     # replace dict with defaults if values are missing (to avoid exceptions)
@@ -473,12 +494,13 @@ def _add_missing_attributes(loaded_dict: dict) -> None:  # pragma: no cover
 def _load_settings_from_dict(loaded_dict: dict) -> Settings:
     try:
         _add_missing_attributes(loaded_dict)
-        settings = Settings(**loaded_dict)
-        filenames = [x.filename for x in settings.sources]
-        if not len(filenames) == len(set(filenames)):
-            non_unique = list({str(x) for x in filenames if filenames.count(x) > 1})
+        settings = Settings.model_validate(loaded_dict)
+        filename_counts = Counter(x.filename for x in settings.sources)
+        non_unique = [str(x) for x, count in filename_counts.items() if count > 1]
+        if non_unique:
             msg = f"Non-unique source filename(s): {', '.join(non_unique)}"
             raise colrev_exceptions.InvalidSettingsError(msg=msg, fix_per_upgrade=False)
+        settings.intern_endpoint_names()
 
     except (Exception,) as exc:  # pragma: no cover
         raise colrev_exceptions.InvalidSettingsError(msg=str(exc)) from exc
@@ -493,8 +515,7 @@ def load_settings(*, settings_path: Path) -> Settings:
         raise colrev_exceptions.RepoSetupError()
 
     try:
-        with open(settings_path, encoding="utf-8") as file:
-            loaded_dict = json.load(file)
+        loaded_dict = json.loads(settings_path.read_bytes())
 
     except json.decoder.JSONDecodeError as exc:
         raise colrev_exceptions.RepoSetupError(
@@ -507,9 +528,16 @@ def load_settings(*, settings_path: Path) -> Settings:
 def save_settings(*, review_manager: colrev.review_manager.ReviewManager) -> None:
     """Save the settings"""
 
-    exported_dict = review_manager.settings.model_dump()
+    # Enums and paths are converted by pydantic-core (mode="json"),
+    # custom_asdict_factory only normalizes the remaining values (e.g., floats)
+    exported_dict = review_manager.settings.model_dump(mode="json")
     exported_dict = colrev.env.utils.custom_asdict_factory(exported_dict)
 
-    with open(review_manager.paths.settings, "w", encoding="utf-8") as outfile:
+    # Write to a temporary file first and replace the settings file
+    # so that an interrupted write cannot leave a truncated settings.json
+    settings_path = review_manager.paths.settings
+    temp_path = settings_path.with_suffix(".json.tmp")
+    with open(temp_path, "w", encoding="utf-8") as outfile:
         json.dump(exported_dict, outfile, indent=4)
+    os.replace(temp_path, settings_path)
     review_manager.dataset.add_changes(review_manager.paths.settings)
@@ -2,10 +2,13 @@
 """Convenience functions to write excel files"""
 from __future__ import annotations
 
-import pandas as pd
+import typing
 
 from colrev.constants import Fields
 
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import pandas as pd
+
 FIELDS = [
     Fields.ID,
     Fields.ENTRYTYPE,
@@ -25,6 +28,10 @@ FIELDS = [
 
 def to_dataframe(*, records_dict: dict) -> pd.DataFrame:
     """Convert a records dict to a pandas DataFrame"""
+    # Note : pandas is imported here (expensive import on startup)
+    # pylint: disable=import-outside-toplevel
+    import pandas as pd
+
     data = []
     for record_id in sorted(records_dict.keys()):
         record_dict = records_dict[record_id]
@@ -40,6 +47,9 @@ def to_dataframe(*, records_dict: dict) -> pd.DataFrame:
 
 def write_file(*, records_dict: dict, filename: str) -> None:
     """Write an excel file from a records dict"""
+    # pylint: disable=import-outside-toplevel
+    import pandas as pd
+
     data_frame = to_dataframe(records_dict=records_dict)
     # pylint: disable=abstract-class-instantiated
     writer = pd.ExcelWriter(filename, engine="xlsxwriter")
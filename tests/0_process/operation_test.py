@@ -39,6 +39,21 @@ def test_check_precondition_load(  # type: ignore
     load_operation.check_precondition()
 
 
+def test_is_ignored() -> None:
+    ignored_prefixes = ("data/pdfs", "data/records.bib")
+
+    assert colrev.process.operation.Operation._is_ignored(
+        "data/pdfs/Smith2020.pdf", ignored_prefixes
+    )
+    assert colrev.process.operation.Operation._is_ignored(
+        "data/records.bib", ignored_prefixes
+    )
+    assert not colrev.process.operation.Operation._is_ignored(
+        "data/pdfs_old/Smith2020.pdf", ignored_prefixes
+    )
+    assert not colrev.process.operation.Operation._is_ignored(None, ignored_prefixes)
+
+
 # def test_conclude(self):
 #     docker_mock = MagicMock()
 #     container_mock = MagicMock()
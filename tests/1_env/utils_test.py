@@ -50,3 +50,31 @@ def test_remove_accents() -> None:
     assert colrev.env.utils.remove_accents("Á") == "A"
     assert colrev.env.utils.remove_accents("Paré") == "Pare"
     assert colrev.env.utils.remove_accents("Müller") == "Muller"
+
+
+def test_load_yaml_file(tmp_path: Path) -> None:
+    yaml_file = tmp_path / "test.yaml"
+    yaml_file.write_text("repos:\n  - id: a\n", encoding="utf-8")
+
+    loaded = colrev.env.utils.load_yaml_file(yaml_file)
+    assert loaded == {"repos": [{"id": "a"}]}
+
+    # Changes to the returned data do not affect the cache
+    loaded["repos"].append({"id": "b"})
+    assert colrev.env.utils.load_yaml_file(yaml_file) == {"repos": [{"id": "a"}]}
+
+    # Changes to the file invalidate the cache
+    yaml_file.write_text("repos:\n  - id: a\n  - id: c\n", encoding="utf-8")
+    assert colrev.env.utils.load_yaml_file(yaml_file) == {
+        "repos": [{"id": "a"}, {"id": "c"}]
+    }
+
+
+def test_dump_yaml(tmp_path: Path) -> None:
+    yaml_file = tmp_path / "status.yaml"
+    data = {"overall": {"md_retrieved": 2}, "title": "Müller"}
+    with open(yaml_file, "w", encoding="utf-8") as file:
+        colrev.env.utils.dump_yaml(data, file)
+
+    assert "Müller" in yaml_file.read_text(encoding="utf-8")
+    assert colrev.env.utils.load_yaml_file(yaml_file) == data
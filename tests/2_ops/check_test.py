@@ -5,6 +5,8 @@ import typing
 from pathlib import Path
 
 import colrev.review_manager
+from colrev.constants import OperationsType
+from colrev.constants import RecordState
 from colrev.constants import SearchType
 
 
@@ -66,3 +68,35 @@ def test_checks(  # type: ignore
             },
         ]
         assert expected == actual
+
+
+def test_get_status_transitions(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager,
+) -> None:
+    """Test the status transitions (based on the process model)"""
+
+    checker = colrev.ops.checker.Checker(review_manager=base_repo_review_manager)
+    status_data: dict = {"start_states": [], "invalid_state_transitions": []}
+    prior = {"colrev_status": [["test.bib/001", RecordState.md_imported]]}
+
+    actual = checker._get_status_transitions(
+        record_id="Srivastava2015",
+        origin=["test.bib/001"],
+        prior=prior,
+        status=RecordState.md_prepared,
+        status_data=status_data,
+    )
+    assert {"Srivastava2015": OperationsType.prep} == actual
+    assert [] == status_data["invalid_state_transitions"]
+
+    actual = checker._get_status_transitions(
+        record_id="Srivastava2015",
+        origin=["test.bib/001"],
+        prior=prior,
+        status=RecordState.rev_included,
+        status_data=status_data,
+    )
+    assert {"Srivastava2015": "load"} == actual
+    assert ["Srivastava2015: md_imported to rev_included"] == status_data[
+        "invalid_state_transitions"
+    ]